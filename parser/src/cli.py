@@ -0,0 +1,254 @@
+"""Unified command-line entry point for the parser workflows.
+
+Usage: ``python -m src.cli {parse|table-markdown|embed} [options]``. Heavy
+modules (the parsing pipeline, pdfplumber, the RAG ingestion stack) are only
+imported by the subcommand that needs them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Callable, Sequence
+
+from src.config import (
+    DEFAULT_PAGE_COUNT,
+    DEFAULT_PDF_PATH,
+    DEFAULT_START_PAGE_INDEX,
+    EMBED_CACHE_FILE,
+    JSON_OUTPUT_FILE,
+    PAGE_WORKERS,
+)
+
+
+def _require_file(path: Path, label: str) -> Path:
+    """Exit with '<label> not found: <path>' unless path is an existing file."""
+    if not path.is_file():
+        raise SystemExit(f"{label} not found: {path}")
+    return path
+
+
+def _add_common_pdf_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--pdf",
+        type=Path,
+        default=DEFAULT_PDF_PATH,
+        help="Path to the source PDF (defaults to 2021 International Building Code).",
+    )
+
+
+def _add_source_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=JSON_OUTPUT_FILE,
+        help="Path to the parsed_document.json file.",
+    )
+
+
+def _cmd_parse(args: argparse.Namespace) -> int:
+    if args.pages <= 0:
+        raise SystemExit("--pages must be positive")
+    if args.start_page <= 0:
+        raise SystemExit("--start-page must be >= 1")
+
+    pdf_path = _require_file(args.pdf, "PDF")
+
+    from src import pipeline
+    from src.utils.table_markdown import rebuild_table_markdown
+
+    logging.info(
+        "Parsing %s starting at page %d for %d pages",
+        pdf_path,
+        args.start_page,
+        args.pages,
+    )
+    pipeline.run_structure_phase(
+        pdf_path=pdf_path,
+        num_pages=args.pages,
+        start_page=args.start_page - 1,
+    )
+
+    if args.skip_table_refresh:
+        return 0
+
+    logging.info("Rebuilding Markdown tables using %s", JSON_OUTPUT_FILE)
+    try:
+        processed = rebuild_table_markdown(
+            pdf_path=pdf_path,
+            json_path=JSON_OUTPUT_FILE,
+            overwrite=args.overwrite_table_markdown,
+            workers=PAGE_WORKERS,
+        )
+    except FileNotFoundError as exc:
+        logging.error("Failed to rebuild table Markdown: %s", exc)
+        return 1
+
+    if processed:
+        logging.info("Updated Markdown for %d table(s).", processed)
+    else:
+        logging.info("Table Markdown already up to date.")
+    return 0
+
+
+def _cmd_table_markdown(args: argparse.Namespace) -> int:
+    from src.utils.table_markdown import rebuild_table_markdown
+
+    try:
+        processed = rebuild_table_markdown(
+            pdf_path=args.pdf,
+            json_path=args.source,
+            table_ids=args.tables,
+            overwrite=args.overwrite,
+            workers=args.workers,
+            checkpoint_every=args.checkpoint_every,
+        )
+    except FileNotFoundError as exc:
+        raise SystemExit(str(exc))
+
+    if processed == 0:
+        logging.info("No tables required Markdown updates.")
+    else:
+        logging.info("Updated %d table(s) in %s", processed, args.source)
+    return 0
+
+
+def _cmd_embed(args: argparse.Namespace) -> int:
+    _require_file(args.source, "JSON file")
+
+    # The ingestion stack lives in the repository-level ``rag`` package
+    from src.scripts._bootstrap import ensure_paths
+
+    ensure_paths()
+    from rag.ingestion import IngestionPipeline
+
+    pipeline = IngestionPipeline(
+        enable_embeddings=not args.skip_embeddings,
+        allow_embedding_fallback=args.allow_embed_fallback,
+        embedding_batch_size=args.embedding_batch_size,
+        embedding_concurrency=args.embedding_concurrency,
+        embedding_cache_path=EMBED_CACHE_FILE if args.embed_cache else None,
+    )
+    document_id = pipeline.ingest(args.source)
+    logging.info("Completed ingestion for document ID %s", document_id)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Building-code parser workflows.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parse = subparsers.add_parser(
+        "parse",
+        help="Parse the configured building code PDF.",
+        description="Parse the configured building code PDF starting at page 32.",
+    )
+    _add_common_pdf_args(parse)
+    parse.add_argument(
+        "--pages",
+        type=int,
+        default=DEFAULT_PAGE_COUNT,
+        help="Number of pages to parse (defaults to the configured full range).",
+    )
+    parse.add_argument(
+        "--start-page",
+        type=int,
+        default=DEFAULT_START_PAGE_INDEX + 1,
+        help="1-indexed page number to begin parsing from (default: 32).",
+    )
+    parse.add_argument(
+        "--skip-table-refresh",
+        action="store_true",
+        help="Skip rebuilding Markdown for detected tables.",
+    )
+    parse.add_argument(
+        "--overwrite-table-markdown",
+        action="store_true",
+        help="Force Markdown regeneration even if an entry already exists.",
+    )
+    parse.set_defaults(handler=_cmd_parse)
+
+    tables = subparsers.add_parser(
+        "table-markdown",
+        help="Rebuild table Markdown in parsed_document.json.",
+        description="Rebuild Markdown tables in parsed_document.json from the source PDF.",
+    )
+    _add_source_arg(tables)
+    _add_common_pdf_args(tables)
+    tables.add_argument(
+        "--tables",
+        nargs="*",
+        default=None,
+        help="Specific table IDs to process (default: process all tables).",
+    )
+    tables.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Rebuild Markdown even if it already exists.",
+    )
+    tables.add_argument(
+        "--workers",
+        type=int,
+        default=PAGE_WORKERS,
+        help=(
+            "Worker processes used to extract tables page by page "
+            "(default: PARSER_PAGE_WORKERS or the CPU count)."
+        ),
+    )
+    tables.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=16,
+        help="Save progress after this many rebuilt tables; 0 saves only at the end (default: 16).",
+    )
+    tables.set_defaults(handler=_cmd_table_markdown)
+
+    embed = subparsers.add_parser(
+        "embed",
+        help="Embed and ingest parsed_document.json.",
+        description="Run the ingestion pipeline with embeddings enabled.",
+    )
+    _add_source_arg(embed)
+    embed.add_argument(
+        "--skip-embeddings",
+        action="store_true",
+        help="Skip embedding generation (useful for offline/local testing).",
+    )
+    embed.add_argument(
+        "--allow-embed-fallback",
+        action="store_true",
+        help="Allow deterministic fallback embeddings if OPENAI_API_KEY is not set.",
+    )
+    embed.add_argument(
+        "--embedding-batch-size",
+        type=int,
+        default=64,
+        help="Batch size for embedding API calls (default: 64).",
+    )
+    embed.add_argument(
+        "--embedding-concurrency",
+        type=int,
+        default=4,
+        help="Number of embedding batches to request in parallel (default: 4).",
+    )
+    embed.add_argument(
+        "--embed-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=f"Reuse embeddings stored in {EMBED_CACHE_FILE.name} across runs (default: enabled).",
+    )
+    embed.set_defaults(handler=_cmd_embed)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    args = build_parser().parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
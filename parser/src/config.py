@@ -12,6 +12,7 @@ IMAGES_DIR = OUTPUT_DIR / "images"
 TABLE_IMAGES_DIR = OUTPUT_DIR / "tables"
 TABLE_REGIONS_FILE = OUTPUT_DIR / "table_regions.json"
 JSON_OUTPUT_FILE = OUTPUT_DIR / "parsed_document.json"
+EMBED_CACHE_FILE = OUTPUT_DIR / "embed_cache.sqlite"
 
 # Default PDF parsing settings
 DEFAULT_PDF_PATH = PROJECT_ROOT.parent / "static" / "2021_International_Building_Code.pdf"
@@ -31,6 +32,8 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Processing configuration
 PROGRESS_LOG_INTERVAL = 100  # Log progress every N pages
+# Worker processes for per-page text extraction (1 disables the pool)
+PAGE_WORKERS = max(1, int(os.getenv("PARSER_PAGE_WORKERS", os.cpu_count() or 1)))
 
 # PDF document info
 DOCUMENT_TITLE = "2021 International Building Code"
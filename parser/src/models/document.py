@@ -1,10 +1,17 @@
 """Document structure models for PDF parsing."""
 
+import json
+from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel, Field
 
 from .references import References
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 
 class NumberedItem(BaseModel):
     """Numbered list item within a section."""
@@ -71,3 +78,58 @@ class Document(BaseModel):
         if 'indent' not in kwargs:
             kwargs['indent'] = 2
         return super().model_dump_json(**kwargs)
+
+    def write_json(self, path: str | Path, indent: int = 2) -> None:
+        """Stream the document to ``path`` one chapter/table/figure at a time.
+
+        Produces the same layout as ``model_dump_json(indent=indent)`` without
+        materialising the whole document as a single string first.
+        """
+        pad = " " * indent
+
+        def _nested(text: str, level: int) -> str:
+            # JSON escapes newlines inside strings, so every raw newline is layout.
+            return text.replace("\n", "\n" + pad * level)
+
+        def _dump(value) -> str:
+            # orjson only supports 2-space indentation; fall back to json otherwise
+            if orjson is not None and indent == 2:
+                return orjson.dumps(
+                    value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            return json.dumps(value, indent=indent, ensure_ascii=False)
+
+        def _write_container(handle, key, items, count, brackets, last) -> None:
+            opening, closing = brackets
+            handle.write(f"{pad}\"{key}\": {opening}")
+            if count:
+                handle.write("\n")
+                for idx, item in enumerate(items):
+                    handle.write(pad * 2)
+                    handle.write(item)
+                    handle.write(",\n" if idx < count - 1 else "\n")
+                handle.write(pad)
+            handle.write(closing)
+            handle.write("\n" if last else ",\n")
+
+        chapters = (
+            _nested(chapter.model_dump_json(indent=indent), 2)
+            for chapter in self.chapters
+        )
+        tables = (
+            f"{_dump(key)}: {_nested(_dump(value), 2)}"
+            for key, value in self.tables.items()
+        )
+        figures = (
+            f"{_dump(key)}: {_nested(_dump(value), 2)}"
+            for key, value in self.figures.items()
+        )
+
+        with Path(path).open("w", encoding="utf-8") as handle:
+            handle.write("{\n")
+            handle.write(f"{pad}\"title\": {_dump(self.title)},\n")
+            handle.write(f"{pad}\"version\": {_dump(self.version)},\n")
+            _write_container(handle, "chapters", chapters, len(self.chapters), "[]", False)
+            _write_container(handle, "tables", tables, len(self.tables), "{}", False)
+            _write_container(handle, "figures", figures, len(self.figures), "{}", True)
+            handle.write("}")
@@ -1,7 +1,7 @@
 """Reference type definitions for PDF document parsing."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class Position(BaseModel):
@@ -30,6 +30,8 @@ class InternalSectionReference(Reference):
 class TableData(BaseModel):
     """Table structure data."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     markdown: Optional[str] = Field(
         default=None,
         description="Markdown representation of the table extracted from the PDF",
@@ -100,3 +102,24 @@ class References(BaseModel):
         default_factory=list,
         description="Figure IDs mentioned or extracted in section (e.g., ['figure_705.7'])",
     )
+
+    # Membership indexes for the ID lists above, rebuilt whenever a list was
+    # replaced or appended to outside of add_table/add_figure.
+    _table_ids: set[str] = PrivateAttr(default_factory=set)
+    _figure_ids: set[str] = PrivateAttr(default_factory=set)
+
+    def add_table(self, table_id: str) -> None:
+        """Append a table ID unless it is already referenced."""
+        if len(self._table_ids) != len(self.table):
+            self._table_ids = set(self.table)
+        if table_id not in self._table_ids:
+            self._table_ids.add(table_id)
+            self.table.append(table_id)
+
+    def add_figure(self, figure_id: str) -> None:
+        """Append a figure ID unless it is already referenced."""
+        if len(self._figure_ids) != len(self.figures):
+            self._figure_ids = set(self.figures)
+        if figure_id not in self._figure_ids:
+            self._figure_ids.add(figure_id)
+            self.figures.append(figure_id)
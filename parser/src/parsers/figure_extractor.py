@@ -5,6 +5,7 @@ import re
 from pathlib import Path
 from typing import Optional, Sequence
 
+from src.config import PROGRESS_LOG_INTERVAL
 from src.utils.figures import FigureLabel
 
 from .pdf_extractor import PDFExtractor
@@ -25,6 +26,8 @@ class FigureExtractor:
         self.pdf_extractor = pdf_extractor
         self.images_dir = Path(images_dir)
         self.images_dir.mkdir(parents=True, exist_ok=True)
+        # Image paths are recorded relative to the output root
+        self._relative_images_dir = Path(self.images_dir.name)
         
         # Track extracted images and IDs to avoid duplicates
         self.extracted_xrefs: set[int] = set()
@@ -92,7 +95,9 @@ class FigureExtractor:
                 
                 # Skip if already extracted (same image referenced multiple times)
                 if xref in self.extracted_xrefs:
-                    logger.debug(f"Skipping duplicate image xref={xref} on page {page_num + 1}")
+                    logger.debug(
+                        "Skipping duplicate image xref=%s on page %d", xref, page_num + 1
+                    )
                     continue
                 
                 try:
@@ -116,9 +121,12 @@ class FigureExtractor:
                         f.write(image_info["data"])
                     
                     logger.debug(
-                        f"Saved figure {figure_id} from page {page_num + 1}: "
-                        f"{image_info['width']}x{image_info['height']} "
-                        f"{image_info['extension'].upper()}"
+                        "Saved figure %s from page %d: %sx%s %s",
+                        figure_id,
+                        page_num + 1,
+                        image_info["width"],
+                        image_info["height"],
+                        image_info["extension"].upper(),
                     )
                     
                     # Create figure metadata
@@ -126,7 +134,7 @@ class FigureExtractor:
                         "figure_id": figure_id,
                         "page": page_num + 1,  # 1-indexed for user display
                         "page_label": page_label_str,
-                        "image_path": str(image_path.relative_to(image_path.parent.parent)),
+                        "image_path": str(self._relative_images_dir / image_filename),
                         "width": image_info["width"],
                         "height": image_info["height"],
                         "format": image_info["extension"].upper(),
@@ -196,11 +204,13 @@ class FigureExtractor:
                 figure_id = figure["figure_id"]
                 all_figures[figure_id] = figure
             
-            # Log progress every 100 pages
-            if (page_num + 1) % 100 == 0:
+            # Log progress every PROGRESS_LOG_INTERVAL pages
+            if (page_num + 1) % PROGRESS_LOG_INTERVAL == 0:
                 logger.info(
-                    f"Processed {page_num + 1}/{end_page} pages "
-                    f"({len(all_figures)} figures extracted so far)..."
+                    "Processed %d/%d pages (%d figures extracted so far)...",
+                    page_num + 1,
+                    end_page,
+                    len(all_figures),
                 )
         
         logger.info(
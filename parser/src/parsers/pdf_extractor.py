@@ -24,6 +24,8 @@ class PDFExtractor:
         self.doc: Optional[fitz.Document] = None
         self.remove_headers_footers = remove_headers_footers
         self.header_filter = HeaderFooterFilter(self)
+        # Last page's get_text("dict") output, shared by span/line/table helpers
+        self._page_dict_cache: tuple[int, dict] | None = None
         self._open_document()
 
     # ------------------------------------------------------------------
@@ -48,11 +50,21 @@ class PDFExtractor:
             raise ValueError(f"Invalid page number: {page_num}")
         return doc[page_num]
 
+    def get_page_dict(self, page_num: int) -> dict:
+        """Return ``page.get_text("dict")``, reusing it for repeated calls on a page."""
+        cached = self._page_dict_cache
+        if cached is not None and cached[0] == page_num:
+            return cached[1]
+        page_dict = self._get_page(page_num).get_text("dict")
+        self._page_dict_cache = (page_num, page_dict)
+        return page_dict
+
     def close(self) -> None:
         doc = self.doc
         if doc:
             doc.close()
             self.doc = None
+            self._page_dict_cache = None
             logger.info("Closed PDF document")
 
     def __enter__(self) -> "PDFExtractor":
@@ -82,15 +94,13 @@ class PDFExtractor:
 
     def extract_page_text_with_blocks(self, page_num: int) -> list[dict]:
         """Return low-level text spans (coordinates, font, flags) for a page."""
-        page = self._get_page(page_num)
-        spans = list(_iter_text_spans(page))
+        spans = list(_iter_text_spans(self.get_page_dict(page_num)))
         logger.debug("Extracted %d spans from page %d", len(spans), page_num + 1)
         return spans
 
     def extract_page_lines_with_fonts(self, page_num: int) -> list[dict]:
         """Return line-level text with approximated font/weight metadata."""
-        page = self._get_page(page_num)
-        lines = _collect_line_features(page)
+        lines = _collect_line_features(self.get_page_dict(page_num))
         logger.debug("Extracted %d line features from page %d", len(lines), page_num + 1)
         return lines
 
@@ -174,9 +184,9 @@ class PDFExtractor:
 # ----------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------
-def _iter_text_spans(page: fitz.Page) -> Iterator[dict]:
-    """Yield flattened span dictionaries for a PyMuPDF page."""
-    for block in page.get_text("dict").get("blocks", []):
+def _iter_text_spans(page_dict: dict) -> Iterator[dict]:
+    """Yield flattened span dictionaries for a PyMuPDF page's text dict."""
+    for block in page_dict.get("blocks", []):
         if block.get("type") != 0:
             continue
         for line in block.get("lines", []):
@@ -193,10 +203,10 @@ def _iter_text_spans(page: fitz.Page) -> Iterator[dict]:
                 }
 
 
-def _collect_line_features(page: fitz.Page) -> list[dict]:
+def _collect_line_features(page_dict: dict) -> list[dict]:
     """Aggregate spans into line-level metadata records."""
     lines: list[dict] = []
-    for block in page.get_text("dict").get("blocks", []):
+    for block in page_dict.get("blocks", []):
         if block.get("type") != 0:
             continue
         for line in block.get("lines", []):
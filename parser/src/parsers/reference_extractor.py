@@ -16,6 +16,35 @@ from ..utils.patterns import PATTERNS
 
 logger = logging.getLogger(__name__)
 
+# Prefixes stripped from matched references to keep just the identifier
+_SECTION_PREFIX_PATTERN = re.compile(r'\b[Ss]ections?\s+', re.IGNORECASE)
+_FIGURE_PREFIX_PATTERN = re.compile(r'\b[Ff]igures?\s+', re.IGNORECASE)
+_FIG_ABBREV_PREFIX_PATTERN = re.compile(r'\bFig\.\s+', re.IGNORECASE)
+
+
+def _build_reference_scanner() -> tuple[re.Pattern, list[tuple[str, str]]]:
+    """Fold every reference pattern into one alternation of named groups.
+
+    Returns the combined pattern plus (group name, reference kind) pairs in
+    the original pattern order, which is also the order results are emitted.
+    """
+    sources = (
+        ("section", [PATTERNS['internal_section']]),
+        ("figure", PATTERNS['figure']),
+        ("external", PATTERNS['external_doc']),
+    )
+    groups: list[tuple[str, str]] = []
+    alternatives: list[str] = []
+    for kind, patterns in sources:
+        for idx, pattern in enumerate(patterns):
+            name = f"{kind}_{idx}"
+            groups.append((name, kind))
+            alternatives.append(f"(?P<{name}>{pattern.pattern})")
+    return re.compile("|".join(alternatives), re.IGNORECASE), groups
+
+
+_REFERENCE_PATTERN, _REFERENCE_GROUPS = _build_reference_scanner()
+
 
 class ReferenceExtractor:
     """Extract and classify references from text."""
@@ -38,10 +67,11 @@ class ReferenceExtractor:
         if not text:
             return references
         
-        # Extract each type of reference
-        references.internal_sections = self._extract_internal_sections(text)
-        references.figures = self._extract_figures(text)
-        references.external_documents = self._extract_external_documents(text)
+        # Single pass over the text, then split matches by reference type
+        matches = self._scan(text)
+        references.internal_sections = self._extract_internal_sections(matches["section"])
+        references.figures = self._extract_figures(matches["figure"])
+        references.external_documents = self._extract_external_documents(matches["external"])
         
         total_refs = (
             len(references.internal_sections) +
@@ -59,24 +89,39 @@ class ReferenceExtractor:
         
         return references
     
-    def _extract_internal_sections(self, text: str) -> list[InternalSectionReference]:
-        """Extract internal section references.
+    def _scan(self, text: str) -> dict[str, list[re.Match]]:
+        """Find all reference matches in one pass over the text.
         
         Args:
             text: Text to scan
             
+        Returns:
+            Matches grouped by reference type, ordered by pattern then position
+        """
+        by_group: dict[str, list[re.Match]] = {name: [] for name, _ in _REFERENCE_GROUPS}
+        for match in _REFERENCE_PATTERN.finditer(text):
+            by_group[match.lastgroup].append(match)
+        
+        grouped: dict[str, list[re.Match]] = {"section": [], "figure": [], "external": []}
+        for name, kind in _REFERENCE_GROUPS:
+            grouped[kind].extend(by_group[name])
+        return grouped
+    
+    def _extract_internal_sections(self, matches: list[re.Match]) -> list[InternalSectionReference]:
+        """Build internal section references.
+        
+        Args:
+            matches: Section reference matches
+            
         Returns:
             List of internal section references
         """
         references = []
-        pattern = PATTERNS['internal_section']
         
-        for match in pattern.finditer(text):
+        for match in matches:
             # Extract just the section numbers, remove "Section" prefix
-            full_text = match.group(0)
-            # Extract numbers: "Section 414" -> "414", "Sections 308.4.1 through 308.4.5" -> "308.4.1 through 308.4.5"
-            # Handle case-insensitive: SECTION, Section, section
-            normalized = re.sub(r'\b[Ss]ections?\s+', '', full_text, flags=re.IGNORECASE)
+            # "Section 414" -> "414", "Sections 308.4.1 through 308.4.5" -> "308.4.1 through 308.4.5"
+            normalized = _SECTION_PREFIX_PATTERN.sub('', match.group(0))
             
             ref = InternalSectionReference(
                 reference=normalized,
@@ -86,70 +131,47 @@ class ReferenceExtractor:
         
         return references
     
-    def _extract_figures(self, text: str) -> list[FigureReference]:
-        """Extract figure references.
+    def _extract_figures(self, matches: list[re.Match]) -> list[FigureReference]:
+        """Build figure references.
         
         Args:
-            text: Text to scan
+            matches: Figure reference matches
             
         Returns:
             List of figure references
         """
         references = []
-        seen_positions = set()
-        
-        # Try multiple figure patterns
-        for pattern in PATTERNS['figure']:
-            for match in pattern.finditer(text):
-                # Avoid duplicates from overlapping patterns
-                pos = (match.start(), match.end())
-                if pos in seen_positions:
-                    continue
-                seen_positions.add(pos)
-                
-                # Extract just the figure number, remove "Figure" or "Fig." prefix
-                full_text = match.group(0)
-                # "Figure 1.2" -> "1.2", "Fig. 3.4" -> "3.4", "FIGURE 5" -> "5"
-                # Handle case-insensitive
-                normalized = re.sub(r'\b[Ff]igures?\s+', '', full_text, flags=re.IGNORECASE)
-                normalized = re.sub(r'\bFig\.\s+', '', normalized, flags=re.IGNORECASE)
-                
-                ref = FigureReference(
-                    reference=normalized,
-                    position=Position(start=match.start(), end=match.end())
-                )
-                references.append(ref)
+        
+        for match in matches:
+            # Extract just the figure number, remove "Figure" or "Fig." prefix
+            # "Figure 1.2" -> "1.2", "Fig. 3.4" -> "3.4", "FIGURE 5" -> "5"
+            normalized = _FIGURE_PREFIX_PATTERN.sub('', match.group(0))
+            normalized = _FIG_ABBREV_PREFIX_PATTERN.sub('', normalized)
+            
+            ref = FigureReference(
+                reference=normalized,
+                position=Position(start=match.start(), end=match.end())
+            )
+            references.append(ref)
         
         return references
     
-    def _extract_external_documents(self, text: str) -> list[ExternalDocumentReference]:
-        """Extract external document references.
+    def _extract_external_documents(self, matches: list[re.Match]) -> list[ExternalDocumentReference]:
+        """Build external document references.
         
         Args:
-            text: Text to scan
+            matches: External document matches
             
         Returns:
             List of external document references
         """
-        references = []
-        seen_positions = set()
-        
-        # Try each external document pattern
-        for pattern in PATTERNS['external_doc']:
-            for match in pattern.finditer(text):
-                # Avoid duplicates from overlapping patterns
-                pos = (match.start(), match.end())
-                if pos in seen_positions:
-                    continue
-                seen_positions.add(pos)
-                
-                ref = ExternalDocumentReference(
-                    reference=match.group(0),
-                    position=Position(start=match.start(), end=match.end())
-                )
-                references.append(ref)
-        
-        return references
+        return [
+            ExternalDocumentReference(
+                reference=match.group(0),
+                position=Position(start=match.start(), end=match.end())
+            )
+            for match in matches
+        ]
     
     def extract_and_attach_references(self, section) -> None:
         """Extract references from section text and attach to section.
@@ -131,22 +131,35 @@ class StructureParser:
             font_stats=font_stats,
         )
 
-    def merge_chapters(self, existing: list[Chapter], new: list[Chapter]) -> list[Chapter]:
-        if not existing:
-            return new
+    def merge_chapters(
+        self,
+        existing: list[Chapter],
+        new: list[Chapter],
+        index: dict[int, Chapter] | None = None,
+    ) -> list[Chapter]:
+        """Merge ``new`` chapters into ``existing`` by chapter number.
+
+        When ``index`` (chapter number -> chapter in ``existing``) is supplied it
+        is used for lookups and kept up to date, and ``existing`` is extended in
+        place, so repeated merges stay linear in the number of new chapters.
+        """
+        if index is None:
+            merged = list(existing)
+            index = {}
+            for chapter in merged:
+                index.setdefault(chapter.chapter_number, chapter)
+        else:
+            merged = existing
 
-        merged = list(existing)
         for candidate in new:
-            match = next(
-                (chapter for chapter in merged if chapter.chapter_number == candidate.chapter_number),
-                None,
-            )
+            match = index.get(candidate.chapter_number)
             if match:
                 if candidate.user_notes and not match.user_notes:
                     match.user_notes = candidate.user_notes
                 match.sections.extend(candidate.sections)
             else:
                 merged.append(candidate)
+                index[candidate.chapter_number] = candidate
         return merged
 
     # Line handlers -------------------------------------------------
@@ -275,14 +288,7 @@ class StructureParser:
 
     @staticmethod
     def _line_starts_new_section(line: str) -> bool:
-        patterns = (
-            PATTERNS["part"],
-            PATTERNS["section_header"],
-            PATTERNS["prefix_section"],
-            PATTERNS["section"],
-            PATTERNS["chapter"],
-        )
-        return any(pattern.match(line) for pattern in patterns)
+        return PATTERNS["new_block"].match(line) is not None
 
     @staticmethod
     def _maybe_extend_part_title(title: str, line_idx: int, lines: list[str]) -> str:
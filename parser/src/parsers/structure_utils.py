@@ -21,12 +21,7 @@ def extract_chapter_title(lines: list[str], current_idx: int) -> str:
                 break
             continue
 
-        if (
-            PATTERNS["chapter"].match(line)
-            or PATTERNS["user_notes"].match(line)
-            or PATTERNS["part"].match(line)
-            or PATTERNS["section_header"].match(line)
-        ):
+        if PATTERNS["chapter_title_stop"].match(line):
             break
 
         if line.isupper() or (len(line.split()) <= 6 and not line.endswith(".")):
@@ -36,10 +31,7 @@ def extract_chapter_title(lines: list[str], current_idx: int) -> str:
                 continue
             if i + 1 < len(lines):
                 next_line = lines[i + 1].strip()
-                if (
-                    PATTERNS["part"].match(next_line)
-                    or PATTERNS["section_header"].match(next_line)
-                ):
+                if PATTERNS["part_or_section_header"].match(next_line):
                     break
                 if next_line and (next_line.isupper() or ". . ." in next_line):
                     continue
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable, Optional
 
-import pdfplumber
-
 if TYPE_CHECKING:  # pragma: no cover - runtime only
     from .pdf_extractor import PDFExtractor
 
@@ -19,6 +18,36 @@ from ..utils.tables import extract_table_labels
 
 logger = logging.getLogger(__name__)
 
+# Label patterns shared by detection, filtering, naming and title extraction.
+# Matches: TABLE 1608.2, [F] TABLE 415.6.5, [A] Table 307.1(1), ...
+_TABLE_LABEL_RE = re.compile(
+    r"(?:\[[A-Z]+\]\s+)?TABLE\s+([\d\w\.\-\(\)]+)", re.IGNORECASE
+)
+_FIGURE_LABEL_RE = re.compile(
+    r"(?:\[[A-Z]+\]\s+)?FIGURE\s+[\d\w\.\-\(\)]+", re.IGNORECASE
+)
+_TABLE_TITLE_RE = re.compile(
+    r"^(?:\[[A-Z]+\]\s+)?TABLE\s+[\d\w\.\-\(\)]+\s+(.+)$", re.IGNORECASE
+)
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\.\-\(\)]")
+_NOTE_START_RE = re.compile(r"^(?:For\s+[A-Z]+:|[a-z]\.|[0-9]+\.)")
+_NOTE_STOP_RE = re.compile(r"^(?:TABLE|FIGURE|SECTION|\d+\.\d+)", re.IGNORECASE)
+_SECTION_NUMBER_RE = re.compile(r"^\d+\.\d+")
+_TRAILING_SECTION_RE = re.compile(r"\s+\d+\.\d+.*$")
+
+
+def _line_text(line: dict) -> str:
+    """Concatenate the span texts of a PyMuPDF text-dict line."""
+    return "".join([span.get("text", "") for span in line.get("spans", [])])
+
+
+def _uppercase_ratio(text: str) -> float:
+    """Share of uppercase characters among the non-space characters of text."""
+    letters = len(text) - text.count(" ")
+    if letters <= 0:
+        return 0.0
+    return sum(map(str.isupper, text)) / letters
+
 
 class TableExtractor:
     """Detect tables on PDF pages, snapshot them, and record metadata."""
@@ -36,7 +65,8 @@ class TableExtractor:
 
         self.images_dir = Path(table_images_dir)
         self.images_dir.mkdir(parents=True, exist_ok=True)
-        self._image_counter = 0
+        # Snapshots are stored relative to the output root as "<images dir>/<file>"
+        self._relative_images_dir = Path(self.images_dir.name)
 
         self._region_overrides = self._load_region_overrides(table_regions_file)
 
@@ -45,6 +75,7 @@ class TableExtractor:
         page_num: int,
         pdf_extractor: Optional["PDFExtractor"] = None,
         page_text: str | None = None,
+        table_labels: list[str] | None = None,
     ) -> list[TableData]:
         """Detect table regions for a specific (1-indexed) page and save images."""
         if pdf_extractor is None:
@@ -64,11 +95,14 @@ class TableExtractor:
             return []
 
         # Extract table labels from the page text for naming
-        table_labels = extract_table_labels(page_text) if page_text else []
+        if table_labels is None:
+            table_labels = extract_table_labels(page_text) if page_text else []
 
         pdfplumber_doc = None
         pdfplumber_page = None
         try:
+            import pdfplumber
+
             pdfplumber_doc = pdfplumber.open(self.pdf_path)
             pdfplumber_page = pdfplumber_doc.pages[page_index]
         except Exception as exc:
@@ -83,7 +117,7 @@ class TableExtractor:
             table_label = table_labels[idx] if idx < len(table_labels) else None
 
             relative_path, _ = self._save_table_image(
-                pdf_extractor, page_index, page_num, bbox, table_label
+                pdf_extractor, page_index, page_num, bbox, idx, table_label
             )
             markdown = None
             if pdfplumber_page is not None:
@@ -91,12 +125,12 @@ class TableExtractor:
 
             # Extract table notes/info below the table
             table_info = self._extract_table_notes(
-                pdf_extractor._get_page(page_index), bbox, page_text
+                pdf_extractor.get_page_dict(page_index), bbox, page_text
             )
             
             # Extract table name/title (text between TABLE number and the table itself)
             table_name = self._extract_table_name(
-                pdf_extractor._get_page(page_index), bbox, table_label, page_num, idx
+                pdf_extractor.get_page_dict(page_index), bbox, table_label, page_num, idx
             )
 
             tables.append(
@@ -129,8 +163,6 @@ class TableExtractor:
     ) -> list[tuple[float, float, float, float]]:
         """Use PyMuPDF's built-in table detection to find actual table boundaries."""
         try:
-            import fitz
-
             # First, check if the page actually contains TABLE labels (not just FIGURE)
             if not page_text or not self._page_has_table_labels(page_text):
                 logger.debug(
@@ -172,7 +204,9 @@ class TableExtractor:
                 all_regions.append(region)
 
             # Filter out regions that are likely figures, not tables
-            regions = self._filter_out_figures(page, all_regions, page_text)
+            regions = self._filter_out_figures(
+                pdf_extractor.get_page_dict(page_index), all_regions, page_text
+            )
 
             for region in regions:
                 logger.debug(
@@ -193,46 +227,23 @@ class TableExtractor:
 
     def _page_has_table_labels(self, page_text: str) -> bool:
         """Check if page contains TABLE labels (not FIGURE labels)."""
-        import re
-
-        # Look for TABLE keywords with optional prefix like [F] or [A]
-        # Pattern matches: TABLE, [F] TABLE, [A] TABLE, [BS] TABLE, etc.
-        table_pattern = re.compile(
-            r"(?:\[[A-Z]+\]\s+)?TABLE\s+[\d\w\.\-\(\)]+", re.IGNORECASE
-        )
-
-        # Check if there are TABLE labels
-        table_matches = table_pattern.findall(page_text)
-
-        if not table_matches:
+        # Cheap literal check first; most pages have no tables at all
+        if "TABLE" not in page_text.upper():
             return False
 
         # Additional check: make sure we're not just finding "TABLE" in body text
         # Real table labels usually appear on their own line or at the start of a line
-        lines = page_text.split("\n")
-        has_real_table = False
-        for line in lines:
-            line_stripped = line.strip()
-            # Check if line starts with TABLE or [X] TABLE
-            if re.match(
-                r"^(?:\[[A-Z]+\]\s+)?TABLE\s+[\d\w\.\-\(\)]+",
-                line_stripped,
-                re.IGNORECASE,
-            ):
-                has_real_table = True
-                break
-
-        return has_real_table
+        return any(
+            _TABLE_LABEL_RE.match(line.strip()) for line in page_text.split("\n")
+        )
 
     def _filter_out_figures(
         self,
-        page: "fitz.Page",
+        text_dict: dict,
         regions: list[tuple[float, float, float, float]],
         page_text: str | None,
     ) -> list[tuple[float, float, float, float]]:
         """Filter out regions that are likely figures rather than tables."""
-        import re
-
         if not page_text or not regions:
             return regions
 
@@ -242,34 +253,20 @@ class TableExtractor:
 
         # Get text blocks with positions
         try:
-            text_dict = page.get_text("dict")
             for block in text_dict.get("blocks", []):
                 if block.get("type") != 0:  # Not a text block
                     continue
 
                 for line in block.get("lines", []):
-                    line_text = ""
                     y_pos = line.get("bbox", [0, 0, 0, 0])[1]  # Get y0 coordinate
-
-                    for span in line.get("spans", []):
-                        line_text += span.get("text", "")
-
-                    line_text = line_text.strip()
+                    line_text = _line_text(line).strip()
 
                     # Check if this line contains a TABLE label
-                    if re.match(
-                        r"^(?:\[[A-Z]+\]\s+)?TABLE\s+[\d\w\.\-\(\)]+",
-                        line_text,
-                        re.IGNORECASE,
-                    ):
+                    if _TABLE_LABEL_RE.match(line_text):
                         table_positions.append(y_pos)
 
                     # Check if this line contains a FIGURE label
-                    elif re.match(
-                        r"^(?:\[[A-Z]+\]\s+)?FIGURE\s+[\d\w\.\-\(\)]+",
-                        line_text,
-                        re.IGNORECASE,
-                    ):
+                    elif _FIGURE_LABEL_RE.match(line_text):
                         figure_positions.append(y_pos)
 
         except Exception as exc:
@@ -314,10 +311,11 @@ class TableExtractor:
         page_index: int,
         page_num: int,
         bbox: tuple[float, float, float, float],
+        bbox_index: int,
         table_label: str | None = None,
     ) -> tuple[str | None, Path | None]:
         """Crop the PDF page for the table bbox and save it as an image."""
-        filename = self._build_image_filename(page_num, table_label)
+        filename = self._build_image_filename(page_num, bbox_index, table_label)
         image_path = self.images_dir / filename
         try:
             pdf_extractor.save_page_clip(page_index, bbox, image_path)
@@ -330,36 +328,21 @@ class TableExtractor:
             )
             return None, None
 
-        try:
-            relative_path = image_path.relative_to(self.images_dir.parent)
-        except ValueError:
-            relative_path = image_path.name
-        return str(relative_path), image_path
+        return str(self._relative_images_dir / filename), image_path
 
     def _build_image_filename(
-        self, page_num: int, table_label: str | None = None
+        self, page_num: int, bbox_index: int, table_label: str | None = None
     ) -> str:
         """Generate output filenames like table_415.6.5_p0431.png from TABLE labels."""
-        import re
-
         if table_label:
-            # Extract the table number from labels like:
-            # "TABLE 1608.2", "[F] TABLE 415.6.5", "[A] Table 307.1(1)"
-            match = re.search(
-                r"(?:\[[A-Z]+\]\s+)?TABLE\s+([\d\w\.\-\(\)]+)",
-                table_label,
-                re.IGNORECASE,
-            )
+            match = _TABLE_LABEL_RE.search(table_label)
             if match:
-                table_num = match.group(1)
                 # Clean up the table number (remove any problematic characters for filenames)
-                table_num = re.sub(r"[^\w\.\-\(\)]", "_", table_num)
-                return f"table_{table_num}_p{page_num:04d}.png"
+                table_num = _FILENAME_UNSAFE_RE.sub("_", match.group(1))
                 return f"table_{table_num}_p{page_num:04d}.png"
 
-        # Fallback to counter-based naming if no label found
-        self._image_counter += 1
-        return f"table_p{page_num:04d}_{self._image_counter:05d}.png"
+        # Fallback to position-based naming if no label found
+        return f"table_p{page_num:04d}_{bbox_index:03d}.png"
 
     def _load_region_overrides(
         self,
@@ -418,8 +401,8 @@ class TableExtractor:
         except (TypeError, ValueError):
             return None
 
-        x_min, x_max = sorted((x0, x1))
-        y_min, y_max = sorted((y0, y1))
+        x_min, x_max = (x0, x1) if x0 < x1 else (x1, x0)
+        y_min, y_max = (y0, y1) if y0 < y1 else (y1, y0)
 
         if x_min == x_max or y_min == y_max:
             return None
@@ -428,20 +411,15 @@ class TableExtractor:
 
     def _extract_table_notes(
         self,
-        page: "fitz.Page",
+        text_dict: dict,
         table_bbox: tuple[float, float, float, float],
         page_text: str | None,
     ) -> list[str]:
         """Extract notes and info text below a table (For SI:, a., b., etc.)."""
-        import re
-
         if not page_text:
             return []
 
         try:
-            # Get text blocks with their positions
-            text_dict = page.get_text("dict")
-
             # Table bottom Y coordinate
             table_bottom = table_bbox[3]
 
@@ -461,28 +439,19 @@ class TableExtractor:
                     if line_y < table_bottom or line_y > note_y_threshold:
                         continue
 
-                    # Build line text
-                    line_text = ""
-                    for span in line.get("spans", []):
-                        line_text += span.get("text", "")
-
-                    line_text = line_text.strip()
+                    line_text = _line_text(line).strip()
 
                     # Check if this looks like a table note:
                     # - Starts with "For SI:", "For Imperial:", etc.
                     # - Starts with a lowercase letter followed by period (a., b., c.)
                     # - Starts with a number followed by period (1., 2., 3.)
-                    if re.match(r"^(?:For\s+[A-Z]+:|[a-z]\.|[0-9]+\.)", line_text):
+                    if _NOTE_START_RE.match(line_text):
                         notes.append(line_text)
                     # Sometimes notes continue on next line without prefix
                     elif notes and len(line_text) > 10:
                         # If previous line was a note and this looks like continuation
                         # (doesn't start with TABLE, FIGURE, or section number)
-                        if not re.match(
-                            r"^(?:TABLE|FIGURE|SECTION|\d+\.\d+)",
-                            line_text,
-                            re.IGNORECASE,
-                        ):
+                        if not _NOTE_STOP_RE.match(line_text):
                             # Append to previous note if it's close
                             if line_y - table_bottom < 80:
                                 notes[-1] = notes[-1] + " " + line_text
@@ -495,7 +464,7 @@ class TableExtractor:
 
     def _extract_table_name(
         self,
-        page: "fitz.Page",
+        text_dict: dict,
         table_bbox: tuple[float, float, float, float],
         table_label: str | None,
         page_num: int,
@@ -503,16 +472,10 @@ class TableExtractor:
     ) -> str:
         """Extract the table title/name (text between TABLE number and table itself).
         Always returns a formatted name with TABLE [NUMBER] prefix."""
-        import re
-        
         # Extract table number from label
         table_number = None
         if table_label:
-            match = re.search(
-                r'(?:\[[A-Z]+\]\s+)?TABLE\s+([\d\w\.\-\(\)]+)',
-                table_label,
-                re.IGNORECASE
-            )
+            match = _TABLE_LABEL_RE.search(table_label)
             if match:
                 table_number = match.group(1)
         
@@ -525,9 +488,6 @@ class TableExtractor:
         
         if table_label:
             try:
-                # Get text blocks with their positions
-                text_dict = page.get_text("dict")
-                
                 # Table top Y coordinate
                 table_top = table_bbox[1]
                 
@@ -539,18 +499,10 @@ class TableExtractor:
                         continue
                     
                     for line in block.get("lines", []):
-                        line_text = ""
-                        for span in line.get("spans", []):
-                            line_text += span.get("text", "")
-                        
-                        line_text_stripped = line_text.strip()
+                        line_text_stripped = _line_text(line).strip()
                         
                         # Check if this is the TABLE label line
-                        if re.search(
-                            r'(?:\[[A-Z]+\]\s+)?TABLE\s+[\d\w\.\-\(\)]+',
-                            line_text_stripped,
-                            re.IGNORECASE
-                        ):
+                        if _TABLE_LABEL_RE.search(line_text_stripped):
                             label_y = line.get("bbox", [0, 0, 0, 0])[1]
                             label_line = line_text_stripped
                             break
@@ -561,15 +513,11 @@ class TableExtractor:
                 if label_y is not None and label_line is not None:
                     # Check if the TABLE label line already contains the title
                     # e.g., "TABLE 1006.3.3 MINIMUM NUMBER OF EXITS..."
-                    match = re.match(
-                        r'^(?:\[[A-Z]+\]\s+)?TABLE\s+[\d\w\.\-\(\)]+\s+(.+)$',
-                        label_line,
-                        re.IGNORECASE
-                    )
+                    match = _TABLE_TITLE_RE.match(label_line)
                     if match:
                         potential_title = match.group(1).strip()
                         # Only accept if it's mostly uppercase (indicates a title, not body text)
-                        if len(potential_title) > 0 and sum(1 for c in potential_title if c.isupper()) / len(potential_title.replace(' ', '')) > 0.5:
+                        if _uppercase_ratio(potential_title) > 0.5:
                             title = potential_title
                     
                     # If no title found yet, look for title text immediately after the TABLE label
@@ -588,32 +536,25 @@ class TableExtractor:
                                 if line_y <= label_y or line_y >= min(max_title_y, table_top):
                                     continue
                                 
-                                # Build line text
-                                line_text = ""
-                                for span in line.get("spans", []):
-                                    line_text += span.get("text", "")
-                                
-                                line_text = line_text.strip()
+                                line_text = _line_text(line).strip()
                                 
                                 # Skip if empty
                                 if not line_text:
                                     continue
                                 
                                 # Skip if it looks like body text or section numbers
-                                if re.match(r'^\d+\.\d+', line_text):
+                                if _SECTION_NUMBER_RE.match(line_text):
                                     continue
                                 
                                 # Only accept if it's mostly uppercase and looks like a title
-                                if len(line_text.replace(' ', '')) > 0:
-                                    uppercase_ratio = sum(1 for c in line_text if c.isupper()) / len(line_text.replace(' ', ''))
-                                    if uppercase_ratio > 0.5:  # More than 50% uppercase
-                                        name_lines.append(line_text)
+                                if _uppercase_ratio(line_text) > 0.5:  # More than 50% uppercase
+                                    name_lines.append(line_text)
                         
                         if name_lines:
                             # Join multi-line titles
                             full_title = " ".join(name_lines)
                             # Clean up: remove any trailing section numbers or body text
-                            full_title = re.sub(r'\s+\d+\.\d+.*$', '', full_title)
+                            full_title = _TRAILING_SECTION_RE.sub("", full_title)
                             title = full_title.strip()
                 
             except Exception as exc:
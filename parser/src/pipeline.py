@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 from src.config import (
@@ -18,23 +20,25 @@ from src.parsers import (
     PDFExtractor,
     ReferenceExtractor,
     StructureParser,
-    TableExtractor,
 )
 from src.parsers.figure_extractor import FigureExtractor
 from src.pipeline_helpers import (
     attach_figures_to_sections,
     attach_tables_to_sections,
 )
-from src.utils.figures import extract_figure_labels
-from .pipeline_pdf import run_pdf_phase
-from tqdm.auto import tqdm
+from .pipeline_pdf import build_page_context, map_pages, run_pdf_phase
 
 EVENT_LOG_FILE = OUTPUT_DIR / "events.log"
 _events_logger = logging.getLogger("parser.events")
 if not _events_logger.handlers:
     handler = logging.FileHandler(EVENT_LOG_FILE, mode="w", encoding="utf-8")
     handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
-    _events_logger.addHandler(handler)
+    # Buffer events so per-table/figure messages don't each cost a write()
+    buffered_handler = MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=handler
+    )
+    _events_logger.addHandler(buffered_handler)
+    atexit.register(buffered_handler.flush)
 _events_logger.setLevel(logging.INFO)
 
 
@@ -44,19 +48,22 @@ def run_structure_phase(
     start_page: int,
 ) -> None:
     """Parse document structure with progress bar and event logging."""
+    from tqdm.auto import tqdm
+
+    from src.parsers.table_extractor import TableExtractor
+
     structure_parser = StructureParser()
     reference_extractor = ReferenceExtractor()
     metadata_collector = MetadataCollector()
 
-    table_extractor = TableExtractor(
-        pdf_path,
-        TABLE_IMAGES_DIR,
-        TABLE_REGIONS_FILE,
-    )
+    # Created on the first page that can yield tables (label text or region overrides)
+    table_extractor: TableExtractor | None = None
+    has_region_overrides = TABLE_REGIONS_FILE.exists()
 
     # Document-level tables and figures storage
     document_tables: dict[str, dict] = {}
     document_figures: dict[str, dict] = {}
+    table_label_counts: dict[str, int] = {}
 
     with PDFExtractor(pdf_path) as extractor:
         figure_extractor = FigureExtractor(extractor, IMAGES_DIR)
@@ -69,17 +76,28 @@ def run_structure_phase(
 
         pages_to_parse = min(num_pages, total_pages - start_page)
         all_chapters: list[Chapter] = []
+        chapter_index: dict[int, Chapter] = {}
         all_orphan_sections = []
 
-        with tqdm(total=pages_to_parse, desc="Parsing pages", unit="page") as progress:
-            for page_offset in range(pages_to_parse):
-                page_num = start_page + page_offset
-                text = extractor.extract_page_text(page_num)
-                line_features = extractor.extract_page_lines_with_fonts(page_num)
+        with tqdm(
+            total=pages_to_parse,
+            desc="Parsing pages",
+            unit="page",
+            mininterval=0.5,
+            miniters=10,
+        ) as progress:
+            page_contexts = map_pages(
+                pdf_path,
+                range(start_page, start_page + pages_to_parse),
+                build_page_context,
+                extractor=extractor,
+            )
+            for ctx in page_contexts:
+                page_num = ctx.num
                 chapters, orphan_sections = structure_parser.parse_page_structure(
-                    text,
+                    ctx.text,
                     page_num + 1,
-                    line_features=line_features,
+                    line_features=ctx.line_features,
                 )
 
                 if chapters:
@@ -92,16 +110,26 @@ def run_structure_phase(
                         )
 
                 tables: list[TableData] = []
-                # Always attempt table extraction - PyMuPDF's find_tables() is efficient
-                # and will only extract actual tables with proper boundaries
-                _events_logger.debug(
-                    "Page %d: Attempting table detection", page_num + 1
-                )
-                tables = table_extractor.extract_tables(
-                    page_num + 1,
-                    pdf_extractor=extractor,
-                    page_text=text,
-                )
+                if table_extractor is None and (
+                    has_region_overrides or "TABLE" in ctx.text.upper()
+                ):
+                    table_extractor = TableExtractor(
+                        pdf_path,
+                        TABLE_IMAGES_DIR,
+                        TABLE_REGIONS_FILE,
+                    )
+                if table_extractor is not None:
+                    # Attempt table extraction - PyMuPDF's find_tables() is efficient
+                    # and will only extract actual tables with proper boundaries
+                    _events_logger.debug(
+                        "Page %d: Attempting table detection", page_num + 1
+                    )
+                    tables = table_extractor.extract_tables(
+                        page_num + 1,
+                        pdf_extractor=extractor,
+                        page_text=ctx.text,
+                        table_labels=ctx.table_labels,
+                    )
                 if tables:
                     _events_logger.debug(
                         "Page %d: Successfully extracted %d table(s)",
@@ -113,18 +141,19 @@ def run_structure_phase(
                         chapters,
                         tables,
                         page_num + 1,
-                        text,
+                        ctx.text,
                         structure_parser.last_section,
                         document_tables,
                         _events_logger,
+                        table_labels=ctx.table_labels,
+                        label_counts=table_label_counts,
                     )
 
                 # Extract figures from page with detected labels/captions
-                figure_labels = extract_figure_labels(text)
                 figures = figure_extractor.extract_figures_from_page(
                     page_num,
                     str(page_num + 1),
-                    figure_labels=figure_labels,
+                    figure_labels=ctx.figure_labels,
                 )
                 if figures:
                     attach_figures_to_sections(
@@ -136,39 +165,31 @@ def run_structure_phase(
                         _events_logger,
                     )
 
-                all_chapters = structure_parser.merge_chapters(all_chapters, chapters)
-                if structure_parser.current_chapter:
-                    for ch in all_chapters:
-                        if (
-                            ch.chapter_number
-                            == structure_parser.current_chapter.chapter_number
-                        ):
-                            structure_parser.current_chapter = ch
-                            break
+                all_chapters = structure_parser.merge_chapters(
+                    all_chapters, chapters, chapter_index
+                )
+                current = structure_parser.current_chapter
+                if current:
+                    structure_parser.current_chapter = chapter_index.get(
+                        current.chapter_number, current
+                    )
 
                 all_orphan_sections.extend(orphan_sections)
                 progress.update(1)
 
-    cleaned_chapters = []
-    seen_chapters = {}
+    merged_chapters: dict[int, Chapter] = {}
     for chapter in all_chapters:
-        chapter_key = chapter.chapter_number
-        has_content = bool(chapter.sections or chapter.user_notes)
-        if chapter_key in seen_chapters:
-            existing = seen_chapters[chapter_key]
-            if has_content:
-                if not (existing.sections or existing.user_notes):
-                    seen_chapters[chapter_key] = chapter
-                else:
-                    if chapter.user_notes and not existing.user_notes:
-                        existing.user_notes = chapter.user_notes
-                    existing.sections.extend(chapter.sections)
-        else:
-            if has_content:
-                seen_chapters[chapter_key] = chapter
-                cleaned_chapters.append(chapter)
-
-    all_chapters = cleaned_chapters
+        if not (chapter.sections or chapter.user_notes):
+            continue
+        existing = merged_chapters.get(chapter.chapter_number)
+        if existing is None:
+            merged_chapters[chapter.chapter_number] = chapter
+            continue
+        if chapter.user_notes and not existing.user_notes:
+            existing.user_notes = chapter.user_notes
+        existing.sections.extend(chapter.sections)
+
+    all_chapters = list(merged_chapters.values())
     for chapter in all_chapters:
         for section in chapter.sections:
             reference_extractor.extract_and_attach_references(section)
@@ -183,5 +204,7 @@ def run_structure_phase(
         tables=document_tables,
         figures=document_figures,
     )
-    json_output = document.model_dump_json(indent=2)
-    JSON_OUTPUT_FILE.write_text(json_output)
+    document.write_json(JSON_OUTPUT_FILE)
+
+    for events_handler in _events_logger.handlers:
+        events_handler.flush()
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Iterable
 
 from src.models import Chapter, Section, TableData
-from src.utils.tables import extract_table_labels
+from src.utils.tables import iter_table_labels
 
 
 def attach_tables_to_sections(
@@ -18,14 +17,19 @@ def attach_tables_to_sections(
     fallback_section: Section | None,
     document_tables: dict[str, dict] | None,
     events_logger: logging.Logger,
+    *,
+    table_labels: list[str] | None = None,
+    label_counts: dict[str, int] | None = None,
 ) -> None:
     """Store extracted tables and hook them up to the appropriate section."""
+    if not tables:
+        return
     if document_tables is None:
         document_tables = {}
+    if label_counts is None:
+        label_counts = {}
 
-    sections_on_page = [section for chapter in chapters for section in chapter.sections]
-    if not sections_on_page and fallback_section is not None:
-        sections_on_page = [fallback_section]
+    sections_on_page = _sections_for_page(chapters, fallback_section)
     if not sections_on_page:
         events_logger.warning(
             "Page %d: Found %d table(s) but no sections to attach to",
@@ -34,34 +38,27 @@ def attach_tables_to_sections(
         )
         return
 
-    label_texts = extract_table_labels(page_text)
+    # Consume labels lazily: the page text is only scanned as far as there are tables
+    label_iter = (
+        iter(table_labels) if table_labels is not None else iter_table_labels(page_text)
+    )
 
     for idx, table_data in enumerate(tables):
         target_section = sections_on_page[min(idx, len(sections_on_page) - 1)]
         label = f"{page_num}.{idx + 1}"
-        if idx < len(label_texts):
-            full_label = label_texts[idx]
-            label = re.sub(r"^.*?TABLE\s+", "", full_label, flags=re.IGNORECASE)
-
-        table_key = _dedupe_key(label, document_tables)
-        table_dict = {
-            "page": table_data.page,
-            "accuracy": table_data.accuracy,
-        }
-        if table_data.markdown:
-            table_dict["markdown"] = table_data.markdown
-        if table_data.image_path:
-            table_dict["image_path"] = table_data.image_path
-        if table_data.bbox:
-            table_dict["bbox"] = list(table_data.bbox)
-        if table_data.table_info:
-            table_dict["table_info"] = table_data.table_info
-        if table_data.table_name:
-            table_dict["table_name"] = table_data.table_name
-        document_tables[table_key] = table_dict
-
-        if table_key not in target_section.references.table:
-            target_section.references.table.append(table_key)
+        full_label = next(label_iter, None)
+        if full_label is not None:
+            # Labels always contain "TABLE"; keep only the identifier after it.
+            keyword_pos = full_label.upper().find("TABLE")
+            if keyword_pos >= 0:
+                label = full_label[keyword_pos + 5 :].lstrip()
+            else:
+                label = full_label
+
+        table_key = _dedupe_key(label, document_tables, label_counts)
+        document_tables[table_key] = _table_entry(table_data)
+
+        target_section.references.add_table(table_key)
 
         if target_section.metadata:
             target_section.metadata.has_table = True
@@ -93,13 +90,13 @@ def attach_figures_to_sections(
 ) -> None:
     """Store figure metadata at the document root and link it to sections."""
     figures = list(figures)
+    if not figures:
+        return
 
     if document_figures is None:
         document_figures = {}
 
-    sections_on_page = [section for chapter in chapters for section in chapter.sections]
-    if not sections_on_page and fallback_section is not None:
-        sections_on_page = [fallback_section]
+    sections_on_page = _sections_for_page(chapters, fallback_section)
     if not sections_on_page:
         events_logger.warning(
             "Page %d: Found %d figure(s) but no sections to attach to",
@@ -114,8 +111,7 @@ def attach_figures_to_sections(
 
         document_figures[figure_id] = figure_data
 
-        if figure_id not in target_section.references.figures:
-            target_section.references.figures.append(figure_id)
+        target_section.references.add_figure(figure_id)
 
         if target_section.metadata:
             target_section.metadata.has_figure = True
@@ -137,11 +133,51 @@ def attach_figures_to_sections(
         )
 
 
-def _dedupe_key(base_label: str, storage: dict[str, dict]) -> str:
-    """Ensure generated keys do not collide with existing entries."""
-    table_key = base_label
-    suffix = 1
+# Optional TableData fields copied into the document entry only when non-empty
+_OPTIONAL_TABLE_FIELDS = ("markdown", "image_path", "bbox", "table_info", "table_name")
+
+
+def _table_entry(table_data: TableData) -> dict:
+    """Build the document-level dict for a table straight from its field values."""
+    # Read the model's field storage directly instead of going through
+    # attribute access once per field.
+    fields = table_data.__dict__
+    entry = {"page": fields["page"], "accuracy": fields["accuracy"]}
+    for name in _OPTIONAL_TABLE_FIELDS:
+        value = fields[name]
+        if value:
+            entry[name] = value
+    if "bbox" in entry:
+        entry["bbox"] = list(entry["bbox"])
+    return entry
+
+
+def _sections_for_page(
+    chapters: list[Chapter],
+    fallback_section: Section | None,
+) -> list[Section]:
+    """Sections parsed on this page, or the carried-over section if there are none."""
+    sections = [section for chapter in chapters for section in chapter.sections]
+    if not sections and fallback_section is not None:
+        sections = [fallback_section]
+    return sections
+
+
+def _dedupe_key(
+    base_label: str,
+    storage: dict[str, dict],
+    counts: dict[str, int],
+) -> str:
+    """Ensure generated keys do not collide with existing entries.
+
+    ``counts`` remembers the next suffix per base label, so repeated labels
+    don't re-probe every previously issued key.
+    """
+    suffix = counts.get(base_label, 0)
+    table_key = base_label if suffix == 0 else f"{base_label}_{suffix}"
+    # Only probe further if another label already produced this exact key
     while table_key in storage:
-        table_key = f"{base_label}_{suffix}"
         suffix += 1
+        table_key = f"{base_label}_{suffix}"
+    counts[base_label] = suffix + 1
     return table_key
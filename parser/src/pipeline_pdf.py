@@ -1,27 +1,119 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
 
-from tqdm.auto import tqdm
-
+from src.config import PAGE_WORKERS
 from src.parsers import PDFExtractor
+from src.utils.figures import FigureLabel, extract_figure_labels
+from src.utils.tables import extract_table_labels
+
+T = TypeVar("T")
+
+# Per-process extractor used by pool workers (PyMuPDF documents can't be pickled)
+_worker_extractor: PDFExtractor | None = None
+
+
+@dataclass(slots=True)
+class PageContext:
+    """Per-page inputs extracted once and shared by all downstream steps."""
+
+    num: int
+    text: str
+    line_features: list
+    figure_labels: list[FigureLabel]
+    table_labels: list[str]
+
+
+def build_page_context(extractor: PDFExtractor, page_num: int) -> PageContext:
+    text = extractor.extract_page_text(page_num)
+    return PageContext(
+        num=page_num,
+        text=text,
+        line_features=extractor.extract_page_lines_with_fonts(page_num),
+        figure_labels=extract_figure_labels(text),
+        table_labels=extract_table_labels(text),
+    )
+
+
+def _init_page_worker(pdf_path: str) -> None:
+    global _worker_extractor
+    _worker_extractor = PDFExtractor(pdf_path)
+
+
+def _run_in_worker(func: Callable[[PDFExtractor, int], T], page_num: int) -> T:
+    return func(_worker_extractor, page_num)
+
+
+def map_pages(
+    pdf_path: str | Path,
+    page_nums: Iterable[int],
+    func: Callable[[PDFExtractor, int], T],
+    workers: int = PAGE_WORKERS,
+    extractor: PDFExtractor | None = None,
+) -> Iterator[T]:
+    """Yield ``func(extractor, page_num)`` for each page, in page order.
+
+    With one worker the calls run in-process, reusing ``extractor`` when given.
+    With more, they run in a process pool where each process opens its own
+    extractor; ``func`` must be a module-level function. At most
+    ``workers * 2`` pages are in flight, so results never pile up ahead of a
+    slower consumer.
+    """
+    if workers <= 1:
+        opened = (
+            nullcontext(extractor) if extractor is not None else PDFExtractor(pdf_path)
+        )
+        with opened as page_extractor:
+            for page_num in page_nums:
+                yield func(page_extractor, page_num)
+        return
+
+    window = workers * 2
+    pending: deque[Future[T]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_page_worker,
+        initargs=(str(pdf_path),),
+    ) as pool:
+        for page_num in page_nums:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_run_in_worker, func, page_num))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _sample_page(extractor: PDFExtractor, page_num: int) -> None:
+    extractor.extract_page_text(page_num)
+    extractor.extract_page_text_with_blocks(page_num)
+    extractor.get_images_on_page(page_num)
 
 
 def run_pdf_phase(pdf_path: str | Path, num_pages: int, start_page: int) -> None:
     """Phase 1 sampling with a simple progress bar (no logging)."""
+    from tqdm.auto import tqdm
+
     with PDFExtractor(pdf_path) as extractor:
         total_pages = extractor.get_page_count()
-        if start_page >= total_pages:
-            raise ValueError(
-                f"Start page ({start_page + 1}) is beyond total pages ({total_pages})."
-            )
-
-        pages_to_extract = min(num_pages, total_pages - start_page)
-
-        with tqdm(total=pages_to_extract, desc="Extracting pages", unit="page") as progress:
-            for page_offset in range(pages_to_extract):
-                page_num = start_page + page_offset
-                extractor.extract_page_text(page_num)
-                extractor.extract_page_text_with_blocks(page_num)
-                extractor.get_images_on_page(page_num)
-                progress.update(1)
+    if start_page >= total_pages:
+        raise ValueError(
+            f"Start page ({start_page + 1}) is beyond total pages ({total_pages})."
+        )
+
+    pages_to_extract = min(num_pages, total_pages - start_page)
+    page_nums = range(start_page, start_page + pages_to_extract)
+
+    with tqdm(
+        total=pages_to_extract,
+        desc="Extracting pages",
+        unit="page",
+        mininterval=0.5,
+        miniters=10,
+    ) as progress:
+        for _ in map_pages(pdf_path, page_nums, _sample_page):
+            progress.update(1)
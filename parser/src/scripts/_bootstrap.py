@@ -0,0 +1,25 @@
+"""Make the parser and repository roots importable for the CLI scripts."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PARSER_ROOT = Path(__file__).resolve().parents[2]  # .../parser
+REPO_ROOT = PARSER_ROOT.parent  # .../parsing
+
+_DONE = False
+
+
+def ensure_paths() -> None:
+    """Prepend the parser and repository roots to sys.path once per process."""
+    global _DONE
+    if _DONE:
+        return
+
+    present = set(sys.path)
+    for path in (PARSER_ROOT, REPO_ROOT):
+        path_str = str(path)
+        if path_str not in present:
+            sys.path.insert(0, path_str)
+    _DONE = True
@@ -7,13 +7,15 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-_FIGURE_LINE_PATTERN = re.compile(
-    r'^\s*(FIGURE\s+([A-Z0-9][\w\.\-()]*))(?:\s+(.+))?$', re.IGNORECASE
+# One pass per (stripped) line: either a FIGURE label line, or a line that
+# ends a caption block (another heading keyword or a numbered section start).
+_LINE_PATTERN = re.compile(
+    r'^(?:'
+    r'(?P<label>FIGURE\s+(?P<number>[A-Z0-9][\w\.\-()]*))(?:\s+(?P<rest>.+))?$'
+    r'|(?P<stop>(?:FIGURE|TABLE|CHAPTER|SECTION)\b|\d+(?:\.\d+)*\s+[A-Za-z])'
+    r')',
+    re.IGNORECASE,
 )
-_CAPTION_STOP_PATTERN = re.compile(
-    r'^(?:FIGURE|TABLE|CHAPTER|SECTION)\b', re.IGNORECASE
-)
-_SECTION_START_PATTERN = re.compile(r'^\d+(?:\.\d+)*\s+[A-Za-z]')
 
 
 def _line_is_probably_caption(line: str) -> bool:
@@ -56,16 +58,16 @@ def extract_figure_labels(page_text: str, max_caption_lines: int = 2) -> list[Fi
         return []
 
     labels: list[FigureLabel] = []
-    lines = page_text.splitlines()
+    lines = [line.strip() for line in page_text.splitlines()]
+    matches = [_LINE_PATTERN.match(line) for line in lines]
     idx = 0
 
     while idx < len(lines):
-        line = lines[idx].strip()
-        match = _FIGURE_LINE_PATTERN.match(line)
-        if match:
-            raw_label = match.group(1).strip()
-            figure_number = match.group(2).strip()
-            remainder = (match.group(3) or "").strip()
+        match = matches[idx]
+        if match and match.group("label"):
+            raw_label = match.group("label").strip()
+            figure_number = match.group("number").strip()
+            remainder = (match.group("rest") or "").strip()
             caption_lines: list[str] = []
 
             if remainder:
@@ -73,14 +75,8 @@ def extract_figure_labels(page_text: str, max_caption_lines: int = 2) -> list[Fi
 
             cursor = idx + 1
             while cursor < len(lines) and len(caption_lines) < max_caption_lines:
-                next_line = lines[cursor].strip()
-                if not next_line:
-                    break
-                if (
-                    _FIGURE_LINE_PATTERN.match(next_line)
-                    or _CAPTION_STOP_PATTERN.match(next_line)
-                    or _SECTION_START_PATTERN.match(next_line)
-                ):
+                next_line = lines[cursor]
+                if not next_line or matches[cursor]:
                     break
                 if not _line_is_probably_caption(next_line):
                     break
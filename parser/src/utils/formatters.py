@@ -1,8 +1,15 @@
 """Formatter utilities for text processing."""
 
 import re
+from functools import lru_cache
 
+# TOC formatting: dots and page numbers like " . . . . . 1-1"
+_TOC_LEADER_PATTERN = re.compile(r'\s+\.(?:\s+\.)+\s+[\d\-]+\s*$')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
 
+
+# Titles and headers repeat heavily across pages, so memoize the cleaned form
+@lru_cache(maxsize=8192)
 def clean_text(text: str) -> str:
     """Clean and normalize text.
     
@@ -13,10 +20,10 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove TOC formatting: dots and page numbers like " . . . . . 1-1"
-    text = re.sub(r'\s+\.(?:\s+\.)+\s+[\d\-]+\s*$', '', text)
+    text = _TOC_LEADER_PATTERN.sub('', text)
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_PATTERN.sub(' ', text)
     # Strip leading/trailing whitespace
     text = text.strip()
     return text
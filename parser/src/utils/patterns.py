@@ -46,6 +46,22 @@ TABLE_PATTERN_2: Pattern = re.compile(
     re.IGNORECASE
 )
 
+# Table label lines (e.g., "TABLE 1608.2", "[F] TABLE 415.6.5")
+# Updated to support optional prefixes like [F], [A], [BS], etc.
+TABLE_LABEL_PATTERN: Pattern = re.compile(
+    r'(?:^|\n)\s*(?:\[[A-Z]+\]\s+)?TABLE\s+[A-Z0-9][\w\.\-()]*',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Page footer noise that precedes TABLE labels
+# The keywords share one lazy gap + TABLE tail. The gap is bounded so a keyword
+# with no TABLE shortly after it costs a fixed scan rather than a sweep to the
+# end of the page (the copyright footer itself is well under 500 characters).
+TABLE_FOOTER_PATTERN: Pattern = re.compile(
+    r'(?:FEDERAL COPYRIGHT ACT|COPYRIGHT|LICENSE AGREEMENT).{0,500}?TABLE',
+    re.IGNORECASE | re.DOTALL
+)
+
 # Chapter references
 CHAPTER_REF_PATTERN: Pattern = re.compile(r'Chapter\s+\d+', re.IGNORECASE)
 
@@ -69,6 +85,37 @@ EXTERNAL_DOC_PATTERNS: list[Pattern] = [
 ]
 
 
+def _any_of(*patterns: Pattern) -> Pattern:
+    """Fold patterns into one alternation, keeping each one's case sensitivity."""
+    return re.compile(
+        "|".join(
+            f"(?{'i' if pattern.flags & re.IGNORECASE else '-i'}:{pattern.pattern})"
+            for pattern in patterns
+        )
+    )
+
+
+# Lines that open a new structural block (used to stop title/text continuation)
+NEW_BLOCK_PATTERN: Pattern = _any_of(
+    PART_PATTERN,
+    SECTION_HEADER_PATTERN,
+    PREFIX_SECTION_PATTERN,
+    SECTION_PATTERN,
+    CHAPTER_PATTERN,
+)
+
+# Lines that end a chapter title block
+CHAPTER_TITLE_STOP_PATTERN: Pattern = _any_of(
+    CHAPTER_PATTERN,
+    USER_NOTES_PATTERN,
+    PART_PATTERN,
+    SECTION_HEADER_PATTERN,
+)
+
+# Part or section headings directly following a title line
+PART_OR_SECTION_HEADER_PATTERN: Pattern = _any_of(PART_PATTERN, SECTION_HEADER_PATTERN)
+
+
 # Compiled patterns dictionary for easy access
 PATTERNS: Dict[str, Pattern | list[Pattern]] = {
     'chapter': CHAPTER_PATTERN,
@@ -83,4 +130,7 @@ PATTERNS: Dict[str, Pattern | list[Pattern]] = {
     'chapter_ref': CHAPTER_REF_PATTERN,
     'figure': [FIGURE_PATTERN_1, FIGURE_PATTERN_2],
     'external_doc': EXTERNAL_DOC_PATTERNS,
+    'new_block': NEW_BLOCK_PATTERN,
+    'chapter_title_stop': CHAPTER_TITLE_STOP_PATTERN,
+    'part_or_section_header': PART_OR_SECTION_HEADER_PATTERN,
 }
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List, Sequence
+from typing import TYPE_CHECKING, List, Sequence
 
-import pdfplumber
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import fitz
+    import pdfplumber
 
 logger = logging.getLogger(__name__)
 
+# Ruled tables first, then whitespace-aligned ones. pdfplumber's defaults are
+# the "lines" strategies, so trying None afterwards would only repeat the
+# first (slow) edge/intersection pass.
 _TABLE_SETTINGS_CANDIDATES = (
     {"vertical_strategy": "lines", "horizontal_strategy": "lines"},
     {"vertical_strategy": "text", "horizontal_strategy": "text"},
-    None,
 )
 
 
@@ -28,13 +32,42 @@ def extract_table_markdown_from_page(
     return rows_to_markdown(rows)
 
 
+def extract_table_markdown_from_fitz_page(
+    page: "fitz.Page",
+    bbox: Sequence[float],
+) -> str | None:
+    """Detect a table inside bbox with PyMuPDF and return it as Markdown."""
+    rows = _extract_rows_from_fitz_page(page, bbox)
+    if not rows:
+        return None
+    return rows_to_markdown(rows)
+
+
 def extract_table_markdown_from_pdf(
     pdf_path: str | Path,
     page_index: int,
     bbox: Sequence[float],
 ) -> str | None:
-    """Open the PDF, extract the requested page region, and convert to Markdown."""
+    """Open the PDF, extract the requested page region, and convert to Markdown.
+
+    PyMuPDF's table finder is tried first; pdfplumber is the fallback when it
+    finds nothing or fails.
+    """
+    import fitz  # PyMuPDF
+    import pdfplumber
+
     pdf_path = str(pdf_path)
+    try:
+        with fitz.open(pdf_path) as fitz_doc:
+            if 0 <= page_index < fitz_doc.page_count:
+                markdown = extract_table_markdown_from_fitz_page(
+                    fitz_doc[page_index], bbox
+                )
+                if markdown:
+                    return markdown
+    except Exception as exc:  # pragma: no cover - PyMuPDF internals
+        logger.debug("PyMuPDF table extraction failed, using pdfplumber: %s", exc)
+
     try:
         with pdfplumber.open(pdf_path) as pdf_doc:
             if page_index < 0 or page_index >= len(pdf_doc.pages):
@@ -53,24 +86,38 @@ def extract_table_markdown_from_pdf(
 
 def rows_to_markdown(rows: Sequence[Sequence[str]]) -> str | None:
     """Convert normalized rows into a GitHub-flavored Markdown table."""
-    cleaned = _normalize_rows(rows)
-    if len(cleaned) < 2:
+    if len(rows) < 2:
         return None
 
-    max_cols = max(len(row) for row in cleaned)
-    padded_rows = [_pad_row(row, max_cols) for row in cleaned]
+    # Single pass: normalize cells while tracking width and body content.
+    # Padding only adds empty cells, so content is checked on the raw rows.
+    cleaned: List[List[str]] = []
+    max_cols = 0
+    body_has_content = False
+    for row in rows:
+        normalized_row = [_normalize_cell(cell) for cell in row]
+        if len(normalized_row) > max_cols:
+            max_cols = len(normalized_row)
+        if cleaned and not body_has_content and any(normalized_row):
+            body_has_content = True
+        cleaned.append(normalized_row)
 
-    header = padded_rows[0]
-    body = padded_rows[1:]
-    if not any(cell for cell in header) or not any(
-        any(cell for cell in row) for row in body
-    ):
+    if not any(cleaned[0]) or not body_has_content:
         return None
 
-    header_line = "| " + " | ".join(header) + " |"
-    divider_line = "| " + " | ".join("---" for _ in header) + " |"
-    body_lines = ["| " + " | ".join(row) + " |" for row in body]
-    return "\n".join([header_line, divider_line, *body_lines]).strip()
+    divider = ["---"] * max_cols
+    lines = [_markdown_row(cleaned[0], max_cols), f"| {' | '.join(divider)} |"]
+    lines.extend(_markdown_row(row, max_cols) for row in cleaned[1:])
+    # Every line starts and ends with "|", so no trailing strip() is needed
+    return "\n".join(lines)
+
+
+def _markdown_row(row: List[str], width: int) -> str:
+    """Render one table row, padding missing trailing cells inline."""
+    missing = width - len(row)
+    if missing:
+        return f"| {' | '.join(row + [''] * missing)} |"
+    return f"| {' | '.join(row)} |"
 
 
 def _extract_rows_from_page(
@@ -97,35 +144,41 @@ def _extract_rows_from_page(
     return rows
 
 
-def _normalize_cell(cell: str | None) -> str:
-    if cell is None:
-        return ""
-    value = str(cell).strip().replace("\n", " ")
-    return " ".join(value.split())
+def _extract_rows_from_fitz_page(
+    page: "fitz.Page",
+    bbox: Sequence[float],
+) -> List[List[str]]:
+    """Run PyMuPDF's table finder clipped to bbox and return the first table's rows."""
+    import fitz  # PyMuPDF
 
+    clip = fitz.Rect(*_clean_bbox(bbox))
+    found = page.find_tables(clip=clip)
+    if not found.tables:
+        return []
 
-def _normalize_rows(rows: Sequence[Sequence[str]]) -> List[List[str]]:
-    normalized: List[List[str]] = []
-    for row in rows:
-        normalized_row = [_normalize_cell(cell) for cell in row]
-        normalized.append(normalized_row)
-    return normalized
+    rows: List[List[str]] = []
+    for raw_row in found.tables[0].extract():
+        normalized_row = [_normalize_cell(cell) for cell in raw_row or []]
+        if any(normalized_row):
+            rows.append(normalized_row)
+    return rows
 
 
-def _pad_row(row: Sequence[str], width: int) -> List[str]:
-    padded = list(row)
-    if len(padded) < width:
-        padded.extend([""] * (width - len(padded)))
-    return padded
+def _normalize_cell(cell: str | None) -> str:
+    if cell is None:
+        return ""
+    # split() already drops leading/trailing whitespace and treats newlines as
+    # separators, so one split/join collapses all whitespace in a single pass.
+    return " ".join(str(cell).split())
 
 
 def _clean_bbox(bbox: Sequence[float]) -> tuple[float, float, float, float]:
-    if len(bbox) != 4:
-        raise ValueError(f"Expected bbox with four values, got {bbox!r}")
-    x0, y0, x1, y1 = bbox
-    return (
-        float(min(x0, x1)),
-        float(min(y0, y1)),
-        float(max(x0, x1)),
-        float(max(y0, y1)),
-    )
+    try:
+        x0, y0, x1, y1 = bbox
+    except ValueError:
+        raise ValueError(f"Expected bbox with four values, got {bbox!r}") from None
+    if x0 > x1:
+        x0, x1 = x1, x0
+    if y0 > y1:
+        y0, y1 = y1, y0
+    return float(x0), float(y0), float(x1), float(y1)
@@ -2,19 +2,40 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Mapping, Sequence
 
-import pdfplumber
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
-from .pdf_tables import extract_table_markdown_from_page
+from .pdf_tables import (
+    extract_table_markdown_from_fitz_page,
+    extract_table_markdown_from_page,
+)
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["rebuild_table_markdown"]
 
+# Reused stdlib encoder for when orjson is not installed (same output as
+# json.dump(..., indent=2))
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Per-process (PyMuPDF, pdfplumber) handles used by pool workers
+_worker_docs: tuple | None = None
+
+# Part of markdown_source_hash; bump when the extraction logic changes so
+# Markdown built by the previous logic is rebuilt
+_EXTRACTOR_VERSION = "fitz-first-1"
+
 
 def rebuild_table_markdown(
     pdf_path: str | Path,
@@ -23,6 +44,8 @@ def rebuild_table_markdown(
     table_ids: Sequence[str] | None = None,
     overwrite: bool = False,
     log: logging.Logger | None = None,
+    workers: int = 1,
+    checkpoint_every: int = 0,
 ) -> int:
     """
     Rebuild Markdown table content inside parsed_document.json.
@@ -31,8 +54,17 @@ def rebuild_table_markdown(
         pdf_path: Path to the source PDF.
         json_path: Path to parsed_document.json (updated in-place).
         table_ids: Optional iterable of specific table IDs to refresh.
-        overwrite: When False, only refresh tables missing Markdown.
+        overwrite: When False, only refresh tables with missing or stale Markdown.
         log: Optional logger to use for status messages.
+        workers: Number of worker processes; pages are spread across them
+            when greater than one.
+        checkpoint_every: When positive, save the JSON after this many newly
+            rebuilt tables so an interrupted run resumes where it stopped
+            (tables that already have Markdown are skipped unless overwrite).
+
+    Rebuilt tables are stamped with ``markdown_source_hash`` (extractor version
+    plus a digest of the PDF). Markdown stamped from a different PDF or
+    extractor version is treated as stale and rebuilt even without overwrite.
 
     Returns:
         The number of tables updated.
@@ -47,68 +79,211 @@ def rebuild_table_markdown(
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-    with json_path.open("r", encoding="utf-8") as f:
-        document = json.load(f)
+    raw = json_path.read_bytes()
+    document = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     tables: Mapping[str, dict] = document.get("tables") or {}
     if not tables:
         log.info("No tables found in %s", json_path)
         return 0
 
-    table_filter = set(table_ids) if table_ids else None
+    import fitz  # PyMuPDF
+    import pdfplumber
+
     processed = 0
+    source_key = _markdown_source_key(pdf_path)
 
-    with pdfplumber.open(str(pdf_path)) as pdf_doc:
+    with ExitStack() as stack:
+        fitz_doc = stack.enter_context(fitz.open(str(pdf_path)))
+        pdf_doc = stack.enter_context(pdfplumber.open(str(pdf_path)))
         page_count = len(pdf_doc.pages)
+        batches = _group_tables_by_page(
+            tables, table_ids, overwrite, page_count, source_key, log
+        )
 
-        for table_id, entry in tables.items():
-            if table_filter and table_id not in table_filter:
-                continue
-            if not _should_process_table(entry, overwrite):
-                continue
-
-            page_number = entry.get("page")
-            bbox = entry.get("bbox")
-            if page_number is None or bbox is None:
-                log.warning(
-                    "Table %s is missing page/bbox metadata; skipping.", table_id
+        # Visit pages in order and handle every table on a page against the same
+        # parsed page object instead of going back to the document per table.
+        page_indices = sorted(batches)
+        bbox_batches = [
+            [entry["bbox"] for _, entry in batches[page_index]]
+            for page_index in page_indices
+        ]
+        if workers > 1 and len(page_indices) > 1:
+            pool = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=min(workers, len(page_indices)),
+                    initializer=_init_worker,
+                    initargs=(str(pdf_path),),
                 )
-                continue
+            )
+            # Small chunks keep workers busy on uneven pages while cutting IPC
+            results = pool.map(
+                _run_page_batch, page_indices, bbox_batches, chunksize=4
+            )
+        else:
+            results = (
+                _extract_page_batch(fitz_doc, pdf_doc, page_index, bboxes)
+                for page_index, bboxes in zip(page_indices, bbox_batches)
+            )
 
-            page_index = int(page_number) - 1
-            if page_index < 0 or page_index >= page_count:
-                log.warning(
-                    "Table %s references invalid page %s (document has %s pages).",
-                    table_id,
-                    page_number,
-                    page_count,
+        since_checkpoint = 0
+        for page_index, markdowns in zip(page_indices, results):
+            for (table_id, entry), markdown in zip(batches[page_index], markdowns):
+                if not markdown:
+                    log.warning(
+                        "Unable to extract Markdown for table %s on page %s.",
+                        table_id,
+                        entry["page"],
+                    )
+                    continue
+
+                entry["markdown"] = markdown
+                entry["markdown_source_hash"] = source_key
+                processed += 1
+                since_checkpoint += 1
+
+            if checkpoint_every > 0 and since_checkpoint >= checkpoint_every:
+                _write_document(document, json_path)
+                log.info("Checkpointed %d rebuilt table(s) to %s", processed, json_path)
+                since_checkpoint = 0
+
+    if since_checkpoint:
+        _write_document(document, json_path)
+
+    return processed
+
+
+def _markdown_source_key(pdf_path: Path) -> str:
+    """Identify the extractor version and PDF content Markdown is built from."""
+    with pdf_path.open("rb") as handle:
+        digest = hashlib.file_digest(handle, "md5").hexdigest()[:16]
+    return f"{_EXTRACTOR_VERSION}:{digest}"
+
+
+def _write_document(document: dict, json_path: Path) -> None:
+    """Atomically replace json_path with the serialized document."""
+    tmp_path = json_path.with_name(json_path.name + ".tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(
+            orjson.dumps(document, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        # One encode + one write instead of json.dump's chunk-by-chunk writes
+        tmp_path.write_text(_JSON_ENCODER.encode(document), encoding="utf-8")
+    os.replace(tmp_path, json_path)
+
+
+def _init_worker(pdf_path: str) -> None:
+    global _worker_docs
+    import fitz  # PyMuPDF
+    import pdfplumber
+
+    _worker_docs = (fitz.open(pdf_path), pdfplumber.open(pdf_path))
+
+
+def _run_page_batch(page_index: int, bboxes: list) -> list[str | None]:
+    fitz_doc, pdf_doc = _worker_docs
+    return _extract_page_batch(fitz_doc, pdf_doc, page_index, bboxes)
+
+
+def _extract_page_batch(
+    fitz_doc, pdf_doc, page_index: int, bboxes: list
+) -> list[str | None]:
+    """Return Markdown (or None) for each bbox on a single page.
+
+    PyMuPDF is tried first; the pdfplumber page is only parsed for regions
+    where PyMuPDF finds no table.
+    """
+    fitz_page = fitz_doc[page_index]
+    plumber_page = None
+    markdowns: list[str | None] = []
+    for bbox in bboxes:
+        markdown = None
+        try:
+            markdown = extract_table_markdown_from_fitz_page(fitz_page, bbox)
+        except Exception as exc:  # pragma: no cover - PyMuPDF internals
+            logger.debug("PyMuPDF table extraction failed, using pdfplumber: %s", exc)
+
+        if not markdown:
+            try:
+                if plumber_page is None:
+                    plumber_page = pdf_doc.pages[page_index]
+                markdown = extract_table_markdown_from_page(plumber_page, bbox)
+            except Exception as exc:  # pragma: no cover - pdfplumber internals
+                # One bad region must not abort the remaining tables
+                logger.warning(
+                    "Table extraction failed on page %s at %s: %s",
+                    page_index + 1,
+                    bbox,
+                    exc,
                 )
-                continue
+        markdowns.append(markdown)
 
-            page = pdf_doc.pages[page_index]
-            markdown = extract_table_markdown_from_page(page, bbox)
-            if not markdown:
-                log.warning(
-                    "Unable to extract Markdown for table %s on page %s.",
+    if plumber_page is not None:
+        # Every table on this page is done; drop pdfminer's cached layout objects
+        # so memory stays bounded by one page instead of growing with the run.
+        plumber_page.close()
+    return markdowns
+
+
+def _group_tables_by_page(
+    tables: Mapping[str, dict],
+    table_ids: Sequence[str] | None,
+    overwrite: bool,
+    page_count: int,
+    source_key: str,
+    log: logging.Logger,
+) -> dict[int, list[tuple[str, dict]]]:
+    """Select the tables to rebuild and batch them by zero-based page index."""
+    batches: dict[int, list[tuple[str, dict]]] = {}
+    if table_ids:
+        # Look up just the requested tables (deduplicated, in request order)
+        selected = ((table_id, tables.get(table_id)) for table_id in dict.fromkeys(table_ids))
+    else:
+        selected = tables.items()
+
+    for table_id, entry in selected:
+        if entry is None:
+            continue
+        if not overwrite and _has_current_markdown(entry, source_key):
+            if table_ids:
+                log.info(
+                    "Table %s already has up-to-date Markdown; use overwrite to rebuild it.",
                     table_id,
-                    page_number,
                 )
-                continue
+            continue
 
-            entry["markdown"] = markdown
-            processed += 1
+        page_number = entry.get("page")
+        bbox = entry.get("bbox")
+        if page_number is None or bbox is None:
+            log.warning("Table %s is missing page/bbox metadata; skipping.", table_id)
+            continue
 
-    if processed:
-        with json_path.open("w", encoding="utf-8") as f:
-            json.dump(document, f, indent=2)
+        page_index = int(page_number) - 1
+        if page_index < 0 or page_index >= page_count:
+            log.warning(
+                "Table %s references invalid page %s (document has %s pages).",
+                table_id,
+                page_number,
+                page_count,
+            )
+            continue
 
-    return processed
+        batches.setdefault(page_index, []).append((table_id, entry))
+    return batches
+
+
+def _has_current_markdown(entry: Mapping[str, object], source_key: str) -> bool:
+    """True when entry has Markdown not built from another PDF/extractor version.
+
+    Unstamped Markdown (written by the main parse) counts as current.
+    """
+    stamp = entry.get("markdown_source_hash")
+    return _has_markdown(entry) and (stamp is None or stamp == source_key)
 
 
-def _should_process_table(entry: Mapping[str, object], overwrite: bool) -> bool:
-    if overwrite:
-        return True
+def _has_markdown(entry: Mapping[str, object]) -> bool:
     value = entry.get("markdown") if entry else None
     if isinstance(value, str):
-        return not value.strip()
-    return not value
+        return bool(value.strip())
+    return bool(value)
@@ -2,44 +2,57 @@
 
 from __future__ import annotations
 
-import re
-
-# Regex patterns reused by pipeline helpers and table extraction
-# Updated to support optional prefixes like [F], [A], [BS], etc.
-_TABLE_HINT_PATTERN = re.compile(
-    r"(?:^|\n)\s*(?:\[[A-Z]+\]\s+)?TABLE\s+[A-Z0-9][\w\.\-()]*",
-    re.IGNORECASE | re.MULTILINE,
-)
-_TABLE_LABEL_PATTERN = re.compile(
-    r"(?:^|\n)\s*(?:\[[A-Z]+\]\s+)?TABLE\s+[A-Z0-9][\w\.\-()]*",
-    re.IGNORECASE | re.MULTILINE,
-)
-_FOOTER_PATTERNS: tuple[re.Pattern, ...] = (
-    re.compile(r"COPYRIGHT.*?TABLE", re.IGNORECASE | re.DOTALL),
-    re.compile(r"FEDERAL COPYRIGHT ACT.*?TABLE", re.IGNORECASE | re.DOTALL),
-    re.compile(r"LICENSE AGREEMENT.*?TABLE", re.IGNORECASE | re.DOTALL),
-)
-
-
-def _strip_table_footers(page_text: str | None) -> str:
-    """Remove known footer noise prior to regex searches."""
-    cleaned = page_text or ""
-    for footer_pattern in _FOOTER_PATTERNS:
-        cleaned = footer_pattern.sub("", cleaned)
-    return cleaned
+from bisect import bisect_right
+from typing import Iterator
+
+from .patterns import TABLE_FOOTER_PATTERN, TABLE_LABEL_PATTERN
+
+
+def _footer_spans(page_text: str, upper: str) -> list[tuple[int, int]]:
+    """Return sorted (start, end) spans of footer noise that ends in TABLE.
+
+    ``upper`` is ``page_text.upper()``, computed once by the caller; it gates
+    the regex scan on the footer keywords being present at all.
+    """
+    if "COPYRIGHT" not in upper and "LICENSE AGREEMENT" not in upper:
+        return []
+    return [match.span() for match in TABLE_FOOTER_PATTERN.finditer(page_text)]
+
+
+def _iter_table_label_matches(page_text: str, upper: str) -> Iterator:
+    """Yield TABLE label matches that do not overlap footer noise."""
+    spans = _footer_spans(page_text, upper)
+    starts = [start for start, _ in spans]
+    for match in TABLE_LABEL_PATTERN.finditer(page_text):
+        # The last footer starting before the label's end is the only candidate
+        # that can overlap it, since footer spans never overlap each other.
+        idx = bisect_right(starts, match.end() - 1) - 1
+        if idx >= 0 and spans[idx][1] > match.start():
+            continue
+        yield match
 
 
 def page_has_table_hint(page_text: str | None) -> bool:
     """Heuristic: detect obvious TABLE labels before heavier processing."""
     if not page_text:
         return False
-    cleaned = _strip_table_footers(page_text)
-    return bool(_TABLE_HINT_PATTERN.search(cleaned))
+    upper = page_text.upper()
+    if "TABLE" not in upper:
+        return False
+    return next(_iter_table_label_matches(page_text, upper), None) is not None
+
+
+def iter_table_labels(page_text: str | None) -> Iterator[str]:
+    """Lazily yield ordered TABLE labels detected within page text."""
+    if not page_text:
+        return
+    upper = page_text.upper()
+    if "TABLE" not in upper:
+        return
+    for match in _iter_table_label_matches(page_text, upper):
+        yield match.group(0).strip()
 
 
 def extract_table_labels(page_text: str | None) -> list[str]:
     """Return ordered TABLE labels detected within page text."""
-    if not page_text:
-        return []
-    cleaned = _strip_table_footers(page_text)
-    return [match.group(0).strip() for match in _TABLE_LABEL_PATTERN.finditer(cleaned)]
+    return list(iter_table_labels(page_text))
@@ -2,6 +2,8 @@
 
 import re
 
+_SECTION_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)*')
+
 
 def is_valid_section_number(section_number: str) -> bool:
     """Check if a section number is valid.
@@ -12,8 +14,7 @@ def is_valid_section_number(section_number: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^\d+(?:\.\d+)*$'
-    return bool(re.match(pattern, section_number))
+    return _SECTION_NUMBER_PATTERN.fullmatch(section_number) is not None
 
 
 def is_valid_chapter_number(chapter_number: int) -> bool:
@@ -0,0 +1,74 @@
+"""In-process cache of workflow results keyed by normalized query."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional
+
+from rag.config import settings
+
+
+class AnswerCache:
+    """Thread-safe LRU cache with a per-entry time-to-live.
+
+    Entries are the ``result`` dicts produced by the query workflow; callers
+    must treat returned values as read-only since they are shared.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query: str, options: Optional[Mapping[str, Any]] = None) -> str:
+        """Hash the case/whitespace-normalized query together with its options."""
+        normalized = " ".join(query.lower().split())
+        payload = json.dumps(
+            [normalized, options or {}], sort_keys=True, default=str
+        ).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.maxsize <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_answer_cache() -> AnswerCache:
+    """Get the process-wide answer cache."""
+    return AnswerCache(
+        maxsize=settings.answer_cache_size, ttl=settings.answer_cache_ttl_seconds
+    )
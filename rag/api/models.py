@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, computed_field, field_validator
 
 
 # ============================================================================
@@ -30,14 +30,6 @@ class QueryOptionsModel(BaseModel):
         description="Search strategy: 'hybrid' or 'vector'",
     )
 
-    @field_validator("search_type")
-    @classmethod
-    def validate_search_type(cls, v: str) -> str:
-        """Validate search type is valid."""
-        if v not in ("hybrid", "vector"):
-            raise ValueError("search_type must be 'hybrid' or 'vector'")
-        return v
-
 
 class QueryRequest(BaseModel):
     """Request model for query endpoint."""
@@ -115,16 +107,12 @@ class SearchResponse(BaseModel):
 
     query: str
     results: List[SearchResultModel] = Field(default_factory=list)
-    count: int = Field(..., ge=0)
 
-    @field_validator("count")
-    @classmethod
-    def validate_count_matches_results(cls, v: int, info) -> int:
-        """Ensure count matches actual results length."""
-        results = info.data.get("results", [])
-        if v != len(results):
-            raise ValueError("Count must match number of results")
-        return v
+    @computed_field
+    @property
+    def count(self) -> int:
+        """Number of results, derived so it always matches ``results``."""
+        return len(self.results)
 
 
 # ============================================================================
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import time
 from typing import Any, AsyncIterator, Dict, List, Literal, Optional
@@ -10,7 +12,7 @@ from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from rag.graph.workflow import build_workflow
+from rag.graph.workflow import get_workflow
 
 logger = logging.getLogger(__name__)
 
@@ -131,14 +133,15 @@ async def chat_completions(request: ChatCompletionRequest):
             )
 
         # Run the RAG workflow
-        workflow = build_workflow()
+        workflow = get_workflow()
         state = {
             "query": query,
             "options": request.rag_options,
         }
 
         logger.info(f"Processing LibreChat query: {query[:100]}...")
-        output = workflow.invoke(state)
+        # invoke() blocks on the database and the LLM; keep the event loop free
+        output = await asyncio.to_thread(workflow.invoke, state)
         result = output.get("result")
 
         if not result:
@@ -166,9 +169,16 @@ async def chat_completions(request: ChatCompletionRequest):
         logger.info(f"Formatted answer length: {len(formatted_answer)} chars")
         logger.debug(f"First 200 chars: {formatted_answer[:200]}")
 
-        # Estimate token usage (rough approximation)
-        prompt_tokens = sum(len(msg.content.split()) for msg in request.messages) * 2
-        completion_tokens = len(formatted_answer.split()) * 2
+        if request.stream:
+            return StreamingResponse(
+                _sse_chunks(formatted_answer, request.model),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+            )
+
+        # Estimate token usage (~4 characters per token) without re-scanning text
+        prompt_tokens = sum(len(msg.content) for msg in request.messages) // 4
+        completion_tokens = len(formatted_answer) // 4
 
         response = ChatCompletionResponse(
             id=f"chatcmpl-{int(time.time())}",
@@ -235,10 +245,37 @@ def _extract_query_from_messages(messages: List[ChatMessage]) -> str:
     Takes the last user message as the query. System messages are ignored
     for query extraction but could be used for additional context in the future.
     """
-    for message in reversed(messages):
-        if message.role == "user":
-            return message.content.strip()
-    return ""
+    return next(
+        (message.content.strip() for message in reversed(messages) if message.role == "user"),
+        "",
+    )
+
+
+async def _sse_chunks(answer: str, model: str) -> AsyncIterator[bytes]:
+    """
+    Yield the answer as OpenAI-format server-sent events.
+
+    The answer is sent line by line (newlines kept) so Markdown renders
+    correctly as it arrives, followed by a final ``stop`` chunk and ``[DONE]``.
+    """
+    completion_id = f"chatcmpl-{int(time.time())}"
+    created = int(time.time())
+
+    def encode(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> bytes:
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(chunk)}\n\n".encode()
+
+    yield encode({"role": "assistant"})
+    for line in answer.splitlines(keepends=True):
+        yield encode({"content": line})
+    yield encode({}, "stop")
+    yield b"data: [DONE]\n\n"
 
 
 def _format_answer_with_citations(answer: str, citations: List[Dict[str, Any]]) -> str:
@@ -251,18 +288,18 @@ def _format_answer_with_citations(answer: str, citations: List[Dict[str, Any]])
     if not citations:
         return answer
 
-    formatted = answer + "\n\n**Sources:**\n"
+    parts = [answer, "\n\n**Sources:**\n"]
     for i, citation in enumerate(citations, 1):
         section_num = citation.get("section_number", "N/A")
         title = citation.get("title", "Unknown")
         chapter = citation.get("chapter", "N/A")
         page = citation.get("page", "N/A")
 
-        formatted += f"\n{i}. Section {section_num}: {title}"
+        parts.append(f"\n{i}. Section {section_num}: {title}")
         if chapter != "N/A":
-            formatted += f" (Chapter {chapter}"
             if page != "N/A":
-                formatted += f", Page {page}"
-            formatted += ")"
+                parts.append(f" (Chapter {chapter}, Page {page})")
+            else:
+                parts.append(f" (Chapter {chapter})")
 
-    return formatted
+    return "".join(parts)
@@ -2,35 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
+import hmac
+import json
 import logging
 import os
 import re
 import time
 import uuid
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional
 
-from fastapi import APIRouter, Header, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from rag.graph.workflow import build_workflow
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+from rag.api.cache import get_answer_cache
+from rag.graph.workflow import get_workflow
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1", tags=["openai-compat"])
 RAG_API_KEY = os.getenv("RAG_API_KEY")
+_EXPECTED_API_KEY = RAG_API_KEY.encode() if RAG_API_KEY else None
+
+# Words sent per SSE frame
+STREAM_TOKENS_PER_CHUNK = 8
+# Seconds between SSE comment pings while the workflow is still running
+STREAM_PING_INTERVAL = 15.0
+NO_ANSWER_MESSAGE = "I apologize, but I couldn't generate an answer to your question."
+# Up to STREAM_TOKENS_PER_CHUNK words with their surrounding whitespace, so the
+# matches concatenate back to the exact answer (newlines keep markdown intact)
+_STREAM_CHUNK_PATTERN = re.compile(rf"\s*(?:\S+\s*){{1,{STREAM_TOKENS_PER_CHUNK}}}")
 
+# Answers still being computed for streams whose client disconnected
+_orphaned_answers: set[asyncio.Future] = set()
 
-def _verify_api_key(authorization: Optional[str]) -> None:
+
+def verify_api_key(authorization: Optional[str]) -> None:
     """Enforce optional bearer auth for LibreChat/OpenAI-compatible requests."""
-    if not RAG_API_KEY:
+    if _EXPECTED_API_KEY is None:
         return
 
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing or invalid API key.")
 
     scheme, _, candidate = authorization.partition(" ")
-    if scheme.lower() != "bearer" or candidate != RAG_API_KEY:
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        candidate.encode(), _EXPECTED_API_KEY
+    ):
         raise HTTPException(status_code=401, detail="Missing or invalid API key.")
 
 
@@ -99,7 +124,9 @@ class ModelsListResponse(BaseModel):
 
 @router.post("/chat/completions")
 async def chat_completions(
-    request: ChatCompletionRequest, authorization: Optional[str] = Header(default=None)
+    request: ChatCompletionRequest,
+    response: Response,
+    authorization: Optional[str] = Header(default=None),
 ):
     """
     OpenAI-compatible chat completions endpoint.
@@ -108,7 +135,7 @@ async def chat_completions(
     Compatible with LibreChat and other OpenAI-compatible clients.
     Supports both streaming and non-streaming responses.
     """
-    _verify_api_key(authorization)
+    verify_api_key(authorization)
     logger.info(f"Received chat completion request for model: {request.model}")
 
     # Get last user message
@@ -122,57 +149,38 @@ async def chat_completions(
     logger.info(f"Processing query: {query[:100]}... (streaming={request.stream})")
 
     try:
-        # Run RAG workflow
-        workflow = build_workflow()
-        result = workflow.invoke({"query": query, "options": {}})
-
-        answer = result.get("result", {}).get("answer", "")
-
-        if not answer:
-            answer = "I apologize, but I couldn't generate an answer to your question."
-
-        # Calculate approximate token usage (rough estimate: ~1 token per word)
-        prompt_tokens = sum(len(msg.content.split()) for msg in request.messages)
-        completion_tokens = len(answer.split())
+        # Run RAG workflow, unless this question was answered recently
+        cache = get_answer_cache()
+        cache_key = cache.make_key(query)
+        cached = cache.get(cache_key)
+        cache_status = "HIT" if cached is not None else "MISS"
 
         # Check if streaming is requested
         if request.stream:
-            # Return streaming response
-            async def generate_stream():
-                import json
-
-                # Preserve whitespace (including newlines) to keep markdown intact
-                tokens = [token for token in re.split(r"(\s+)", answer) if token]
-                for i, token in enumerate(tokens):
-                    chunk = {
-                        "id": f"chatcmpl-{uuid.uuid4().hex[:8]}",
-                        "object": "chat.completion.chunk",
-                        "created": int(time.time()),
-                        "model": request.model,
-                        "choices": [
-                            {
-                                "index": 0,
-                                "delta": {"content": token},
-                                "finish_reason": None if i < len(tokens) - 1 else "stop",
-                            }
-                        ],
-                    }
-                    yield f"data: {json.dumps(chunk)}\n\n"
-
-                # Send final done message
-                yield "data: [DONE]\n\n"
-
+            # Start the stream before the workflow finishes so the client and
+            # any proxy see a live connection (pings) during retrieval/generation
             return StreamingResponse(
-                generate_stream(),
+                _stream_answer(
+                    _resolve_answer(query, cached, cache_key), request.model
+                ),
                 media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
                     "Connection": "keep-alive",
+                    "X-Accel-Buffering": "no",
+                    "X-Cache": cache_status,
                 },
             )
         else:
+            answer = await _resolve_answer(query, cached, cache_key)
+
+            # Approximate token usage (~4 characters per token) without re-scanning text
+            prompt_tokens = sum(len(msg.content) for msg in request.messages) // 4
+            completion_tokens = len(answer) // 4
+
             # Return non-streaming response
-            response = ChatCompletionResponse(
+            response.headers["X-Cache"] = cache_status
+            completion = ChatCompletionResponse(
                 id=f"chatcmpl-{uuid.uuid4().hex[:8]}",
                 created=int(time.time()),
                 model=request.model,
@@ -190,7 +198,7 @@ async def chat_completions(
             )
 
             logger.info(f"Generated response with {completion_tokens} tokens")
-            return response
+            return completion
 
     except Exception as e:
         logger.error(f"Error processing chat completion: {e}", exc_info=True)
@@ -201,17 +209,111 @@ async def chat_completions(
 
 
 @router.get("/models", response_model=ModelsListResponse)
-async def list_models(authorization: Optional[str] = Header(default=None)) -> ModelsListResponse:
+async def list_models(authorization: Optional[str] = Header(default=None)) -> Response:
     """List available models for LibreChat/OpenAI-compatible clients."""
-    _verify_api_key(authorization)
-    return ModelsListResponse(
-        object="list",
-        data=[
-            ModelInfo(
-                id="building-code-rag",
-                object="model",
-                created=int(time.time()),
-                owned_by="custom",
-            )
-        ],
+    verify_api_key(authorization)
+    return Response(content=_models_payload(), media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def _models_payload() -> bytes:
+    """Encode the constant model list once; ``created`` is the first-request time."""
+    return _json_bytes(
+        ModelsListResponse(
+            object="list",
+            data=[
+                ModelInfo(
+                    id="building-code-rag",
+                    object="model",
+                    created=int(time.time()),
+                    owned_by="custom",
+                )
+            ],
+        ).model_dump()
     )
+
+
+async def _resolve_answer(
+    query: str, cached: Optional[Dict[str, Any]], cache_key: str
+) -> str:
+    """Return the cached answer or run the workflow (off the event loop) for one."""
+    result = cached
+    if result is None:
+        workflow = get_workflow()
+        output = await asyncio.to_thread(
+            workflow.invoke, {"query": query, "options": {}}
+        )
+        result = output.get("result") or {}
+        if result.get("answer"):
+            get_answer_cache().set(cache_key, result)
+    return result.get("answer") or NO_ANSWER_MESSAGE
+
+
+def _release_orphaned_answer(task: asyncio.Future) -> None:
+    _orphaned_answers.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Workflow for a disconnected stream failed: {task.exception()}")
+
+
+def _json_bytes(value) -> bytes:
+    return orjson.dumps(value) if orjson is not None else json.dumps(value).encode()
+
+
+async def _stream_answer(pending: Awaitable[str], model: str) -> AsyncIterator[bytes]:
+    """Yield the answer as OpenAI chunk frames, several tokens per frame.
+
+    An assistant role frame goes out immediately so clients can render the
+    reply before retrieval finishes. While ``pending`` is still resolving, an
+    SSE comment ping is sent every STREAM_PING_INTERVAL seconds so
+    intermediaries do not drop the idle stream.
+    """
+    task = asyncio.ensure_future(pending)
+
+    # Everything but the delta and finish_reason is fixed for the stream, so
+    # frames are spliced from pre-encoded bytes instead of serializing a dict
+    frame_head = (
+        b'data: {"id":'
+        + _json_bytes(f"chatcmpl-{uuid.uuid4().hex[:8]}")
+        + b',"object":"chat.completion.chunk","created":'
+        + str(int(time.time())).encode()
+        + b',"model":'
+        + _json_bytes(model)
+        + b',"choices":[{"index":0,"delta":'
+    )
+    frame_tail = b'},"finish_reason":null}]}\n\n'
+    last_frame_tail = b'},"finish_reason":"stop"}]}\n\n'
+
+    try:
+        yield frame_head + b'{"role":"assistant","content":""' + frame_tail
+
+        while not task.done():
+            done, _ = await asyncio.wait({task}, timeout=STREAM_PING_INTERVAL)
+            if not done:
+                yield b": ping\n\n"
+    finally:
+        if not task.done():
+            # Starlette closes the generator when the client disconnects. The
+            # workflow thread cannot be interrupted, so let it finish and fill
+            # the answer cache for a retry instead of discarding its result.
+            logger.info("Client disconnected before the answer was ready")
+            _orphaned_answers.add(task)
+            task.add_done_callback(_release_orphaned_answer)
+    try:
+        answer = task.result()
+    except Exception as e:
+        # Headers are already sent, so report the failure in-band
+        logger.error(f"Error processing chat completion: {e}", exc_info=True)
+        answer = NO_ANSWER_MESSAGE
+
+    chunks = _STREAM_CHUNK_PATTERN.findall(answer) or ([answer] if answer else [])
+    last = len(chunks) - 1
+    for index, content in enumerate(chunks):
+        yield (
+            frame_head
+            + b'{"content":'
+            + _json_bytes(content)
+            + (last_frame_tail if index == last else frame_tail)
+        )
+
+    # Send final done message
+    yield b"data: [DONE]\n\n"
@@ -2,26 +2,34 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import asyncio
 
+from fastapi import APIRouter, HTTPException, Response
+
+from rag.api.cache import get_answer_cache
 from rag.api.models import QueryRequest, QueryResultModel
-from rag.graph import build_workflow
+from rag.graph import get_workflow
 
 router = APIRouter(prefix="/query", tags=["query"])
-workflow = build_workflow()
 
 
 @router.post("", response_model=QueryResultModel)
-async def run_query(request: QueryRequest) -> QueryResultModel:
+async def run_query(request: QueryRequest, response: Response) -> QueryResultModel:
     if not request.query.strip():
         raise HTTPException(status_code=400, detail="Query cannot be empty.")
 
     state = {
         "query": request.query,
-        "options": request.options.dict(exclude_none=True) if request.options else {},
+        "options": request.options.model_dump(exclude_none=True) if request.options else {},
     }
-    output = workflow.invoke(state)
-    result = output.get("result")
+    cache = get_answer_cache()
+    cache_key = cache.make_key(state["query"], state["options"])
+    result = cache.get(cache_key)
+    response.headers["X-Cache"] = "HIT" if result is not None else "MISS"
     if result is None:
-        raise HTTPException(status_code=500, detail="Workflow did not return a result.")
+        output = await asyncio.to_thread(get_workflow().invoke, state)
+        result = output.get("result")
+        if result is None:
+            raise HTTPException(status_code=500, detail="Workflow did not return a result.")
+        cache.set(cache_key, result)
     return QueryResultModel(**result)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Query
 
 from rag.api.models import SearchResponse, SearchResultModel
-from rag.graph.nodes import get_hybrid_searcher, get_vector_searcher
+from rag.graph.dependencies import get_hybrid_searcher, get_vector_searcher
 
 router = APIRouter(prefix="/search", tags=["search"])
 
@@ -24,9 +26,11 @@ async def search_endpoint(
     else:
         searcher = get_hybrid_searcher()
 
-    results = searcher.search(q, top_k=limit)
+    results = await asyncio.to_thread(searcher.search, q, top_k=limit)
+    # Hits come from our own typed search results, so skip per-field validation
+    # here; FastAPI still checks the whole payload once against response_model.
     payload = [
-        SearchResultModel(
+        SearchResultModel.model_construct(
             section_number=section.section_number,
             title=section.title,
             text=section.text,
@@ -37,4 +41,4 @@ async def search_endpoint(
         )
         for section in results
     ]
-    return SearchResponse(query=q, results=payload, count=len(payload))
+    return SearchResponse(query=q, results=payload)
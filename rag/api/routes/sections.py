@@ -3,138 +3,126 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
+from psycopg.rows import dict_row
 
 from rag.api.models import SectionDetailModel, SectionSummaryModel
-from rag.database.connection import get_sync_connection
-from rag.retrieval.reference_resolver import ReferenceResolver
+from rag.database.connection import get_async_pool
 
 router = APIRouter(prefix="/sections", tags=["sections"])
-resolver = ReferenceResolver()
+
+_SECTION_FROM = """
+    SELECT
+        s.id,
+        s.section_number,
+        s.title,
+        s.text,
+        s.metadata,
+        s.page_number,
+        s.parent_section_id,
+        s.chapter_number,
+        s.chapter_title{extra}
+    FROM sections s
+"""
+_SECTION_SELECT = _SECTION_FROM.format(extra="")
+
+# Exact section number first, then the original (pre-renumbering) number,
+# resolved in a single round trip
+_SECTION_LOOKUP = f"""
+    ({_SECTION_FROM.format(extra=", 0 AS priority")}
+     WHERE s.section_number = %s
+     LIMIT 1)
+    UNION ALL
+    ({_SECTION_FROM.format(extra=", 1 AS priority")}
+     WHERE s.metadata->>'original_section_number' = %s
+     ORDER BY s.id
+     LIMIT 1)
+    ORDER BY priority
+    LIMIT 1
+"""
+
+# Identifiers of what a section references; only the keys are returned, so
+# there is no need to load full table/figure/section rows for them
+_REFERENCE_QUERIES = {
+    "sections": """
+        SELECT s.section_number
+        FROM sections s
+        WHERE s.id IN (
+            SELECT target_section_id FROM section_references
+            WHERE source_section_id = %s AND reference_type = 'section'
+        )
+    """,
+    "tables": """
+        SELECT t.table_id
+        FROM tables t
+        WHERE t.table_id IN (
+            SELECT reference_text FROM section_references
+            WHERE source_section_id = %s AND reference_type = 'table'
+        )
+    """,
+    "figures": """
+        SELECT f.figure_id
+        FROM figures f
+        WHERE f.figure_id IN (
+            SELECT reference_text FROM section_references
+            WHERE source_section_id = %s AND reference_type = 'figure'
+        )
+    """,
+}
 
 
 @router.get("/{section_number}", response_model=SectionDetailModel)
 async def get_section(section_number: str) -> SectionDetailModel:
-    with get_sync_connection() as conn:
-        section_row = _fetch_section_row(conn, section_number)
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        section_row = await _fetch_section_row(conn, section_number)
         if not section_row:
             raise HTTPException(status_code=404, detail="Section not found.")
 
-        parent = _fetch_section_by_id(conn, section_row["parent_section_id"]) if section_row["parent_section_id"] else None
-        children = _fetch_children(conn, section_row["id"])
-
-    section_model = _row_to_model(section_row)
-    parent_model = _row_to_model(parent) if parent else None
-    children_models = [_row_to_model(child) for child in children]
-
-    references = resolver.resolve([section_model.id])
-    references_payload = {
-        "sections": [section.section_number for section in references.sections],
-        "tables": [table.table_id for table in references.tables],
-        "figures": [figure.figure_id for figure in references.figures],
-    }
+        parent, children, references = await _fetch_related(conn, section_row)
 
     return SectionDetailModel(
-        section=section_model,
-        parent=parent_model,
-        children=children_models,
-        references=references_payload,
+        section=_row_to_model(section_row),
+        parent=_row_to_model(parent) if parent else None,
+        children=[_row_to_model(child) for child in children],
+        references=references,
     )
 
 
-def _fetch_section_row(conn, section_number: str):
-    with conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(
-            """
-            SELECT
-                s.id,
-                s.section_number,
-                s.title,
-                s.text,
-                s.metadata,
-                s.page_number,
-                s.parent_section_id,
-                c.chapter_number,
-                c.title AS chapter_title
-            FROM sections s
-            JOIN chapters c ON s.chapter_id = c.id
-            WHERE s.section_number = %s
-            LIMIT 1
-            """,
-            (section_number,),
-        )
-        row = cur.fetchone()
-        if row:
-            return row
-        cur.execute(
-            """
-            SELECT
-                s.id,
-                s.section_number,
-                s.title,
-                s.text,
-                s.metadata,
-                s.page_number,
-                s.parent_section_id,
-                c.chapter_number,
-                c.title AS chapter_title
-            FROM sections s
-            JOIN chapters c ON s.chapter_id = c.id
-            WHERE s.metadata->>'original_section_number' = %s
-            ORDER BY s.id
-            LIMIT 1
-            """,
-            (section_number,),
-        )
-        return cur.fetchone()
-
-
-def _fetch_section_by_id(conn, section_id: int | None):
-    if section_id is None:
-        return None
-    with conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(
-            """
-            SELECT
-                s.id,
-                s.section_number,
-                s.title,
-                s.text,
-                s.metadata,
-                s.page_number,
-                s.parent_section_id,
-                c.chapter_number,
-                c.title AS chapter_title
-            FROM sections s
-            JOIN chapters c ON s.chapter_id = c.id
-            WHERE s.id = %s
-            """,
-            (section_id,),
-        )
-        return cur.fetchone()
-
-
-def _fetch_children(conn, section_id: int):
-    with conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(
-            """
-            SELECT
-                s.id,
-                s.section_number,
-                s.title,
-                s.text,
-                s.metadata,
-                s.page_number,
-                s.parent_section_id,
-                c.chapter_number,
-                c.title AS chapter_title
-            FROM sections s
-            JOIN chapters c ON s.chapter_id = c.id
+async def _fetch_section_row(conn, section_number: str):
+    async with conn.cursor(row_factory=dict_row) as cur:
+        await cur.execute(_SECTION_LOOKUP, (section_number, section_number))
+        return await cur.fetchone()
+
+
+async def _fetch_related(conn, section_row):
+    """Fetch parent, children and reference identifiers in one pipelined round trip."""
+    section_id = section_row["id"]
+    parent_id = section_row["parent_section_id"]
+    async with conn.pipeline():
+        parent_cur = conn.cursor(row_factory=dict_row)
+        children_cur = conn.cursor(row_factory=dict_row)
+        reference_curs = {kind: conn.cursor() for kind in _REFERENCE_QUERIES}
+
+        if parent_id is not None:
+            await parent_cur.execute(_SECTION_SELECT + "WHERE s.id = %s", (parent_id,))
+        await children_cur.execute(
+            _SECTION_SELECT
+            + """
             WHERE s.parent_section_id = %s
             ORDER BY s.section_number
             """,
             (section_id,),
         )
-        return cur.fetchall()
+        for kind, query in _REFERENCE_QUERIES.items():
+            await reference_curs[kind].execute(query, (section_id,))
+
+        parent = await parent_cur.fetchone() if parent_id is not None else None
+        children = await children_cur.fetchall()
+        references = {
+            kind: [row[0] for row in await cur.fetchall()]
+            for kind, cur in reference_curs.items()
+        }
+    return parent, children, references
 
 
 def _row_to_model(row) -> SectionSummaryModel:
@@ -149,9 +137,3 @@ def _row_to_model(row) -> SectionSummaryModel:
         page_number=row["page_number"],
         metadata=row.get("metadata") or {},
     )
-
-
-try:
-    from psycopg.rows import dict_row
-except ImportError:  # pragma: no cover - psycopg v3 required
-    from psycopg.rows import tuple_row as dict_row
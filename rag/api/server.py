@@ -2,23 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Header, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from rag.api.cache import get_answer_cache
 from rag.api.routes import openai_compat, query, search, sections
 from rag.config import settings
-from rag.database.connection import close_pool, get_pool
+from rag.database.connection import (
+    close_async_pool,
+    close_pool,
+    get_async_pool,
+    get_pool,
+)
+from rag.graph import get_workflow
+from rag.graph.dependencies import get_embedder
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# orjson encodes route payloads several times faster than the stdlib encoder
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
+
+_UNTIMED_PATHS = frozenset({"/", "/health"})
+
+
+def _encode_json(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -31,19 +58,33 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Embedding model: {settings.embedding_model}")
     logger.info(f"Chat model: {settings.chat_model}")
 
+    # Blocking workflow/search calls run via asyncio.to_thread; size the default
+    # executor for them instead of relying on the CPU-count based default
+    executor = ThreadPoolExecutor(
+        max_workers=settings.api_thread_pool_size, thread_name_prefix="rag-api"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+
     # Initialize connection pool
     try:
         pool = get_pool()
+        await get_async_pool()
         logger.info("Database connection pool initialized")
     except Exception as e:
         logger.error(f"Failed to initialize database pool: {e}")
         raise
 
+    # Compile the LangGraph workflow before the first request needs it
+    get_workflow()
+    logger.info("Query workflow compiled")
+
     yield
 
     # Shutdown
     logger.info("Shutting down RAG API server")
+    executor.shutdown(wait=False)
     close_pool()
+    await close_async_pool()
     logger.info("Database connection pool closed")
 
 
@@ -59,6 +100,7 @@ def create_app() -> FastAPI:
         version="0.2.0",
         description="Retrieval-Augmented Generation API for building code queries.",
         lifespan=lifespan,
+        default_response_class=DEFAULT_RESPONSE_CLASS,
     )
 
     # CORS middleware
@@ -73,10 +115,13 @@ def create_app() -> FastAPI:
     # Request timing middleware
     @app.middleware("http")
     async def add_process_time_header(request: Request, call_next):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+        # Skip the header on high-volume liveness probes
+        if request.url.path not in _UNTIMED_PATHS:
+            response.headers["X-Process-Time"] = (
+                f"{(time.perf_counter_ns() - start_ns) / 1e9:.6f}"
+            )
         return response
 
     # Global exception handler
@@ -105,11 +150,19 @@ def create_app() -> FastAPI:
             "openai_configured": settings.is_openai_configured,
         }
 
-    # Root endpoint
-    @app.get("/", tags=["system"])
-    async def root():
-        """API information."""
+    # Cache statistics endpoint (same bearer auth as the /v1 routes)
+    @app.get("/cache/stats", tags=["system"])
+    async def cache_stats(authorization: Optional[str] = Header(default=None)):
+        """Report answer and query-embedding cache usage."""
+        openai_compat.verify_api_key(authorization)
         return {
+            "answers": {"entries": len(get_answer_cache())},
+            "embeddings": get_embedder().cache_stats(),
+        }
+
+    # Root endpoint (constant payload, encoded once)
+    root_payload = _encode_json(
+        {
             "name": "Building Code RAG API",
             "version": "0.2.0",
             "description": "Retrieval-Augmented Generation API for building code queries",
@@ -122,6 +175,12 @@ def create_app() -> FastAPI:
                 "health": "/health",
             },
         }
+    )
+
+    @app.get("/", tags=["system"])
+    async def root():
+        """API information."""
+        return Response(content=root_payload, media_type="application/json")
 
     # Static files (reference PDFs, etc.)
     if settings.static_files_dir:
@@ -8,14 +8,12 @@ from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
 logger = logging.getLogger(__name__)
 
-# Load .env file automatically when this module is imported.
 _env_path = Path(__file__).resolve().parent.parent / ".env"
-load_dotenv(dotenv_path=_env_path, override=False)
 
 
 class Settings(BaseSettings):
@@ -29,11 +27,6 @@ class Settings(BaseSettings):
     # ========================================================================
     # Database Configuration
     # ========================================================================
-    database_url: str = Field(
-        default="",
-        description="Full PostgreSQL connection string. If not provided, "
-        "constructed from individual postgres_* fields.",
-    )
     postgres_host: str = Field(
         default="localhost", description="PostgreSQL server hostname"
     )
@@ -49,6 +42,37 @@ class Settings(BaseSettings):
     postgres_db: str = Field(
         default="building_codes", min_length=1, description="PostgreSQL database name"
     )
+    # Declared after the postgres_* fields so its validator can read them
+    database_url: str = Field(
+        default="",
+        validate_default=True,
+        description="Full PostgreSQL connection string. If not provided, "
+        "constructed from individual postgres_* fields.",
+    )
+    db_pool_min_size: int = Field(
+        default=1, ge=1, description="Connections each pool keeps open"
+    )
+    db_pool_max_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Upper bound for each of the sync and async pools. "
+        "Derived from the server's max_connections when not set.",
+    )
+    db_pool_fraction: float = Field(
+        default=0.25,
+        gt=0.0,
+        le=1.0,
+        description="Share of the server's max_connections the app may use "
+        "across all its pools when db_pool_max_size is derived",
+    )
+    db_pool_hard_cap: int = Field(
+        default=50, ge=1, description="Ceiling for a derived pool size"
+    )
+    app_replicas: int = Field(
+        default=1,
+        ge=1,
+        description="Number of API processes sharing the connection budget",
+    )
 
     # ========================================================================
     # LLM Configuration
@@ -72,6 +96,13 @@ class Settings(BaseSettings):
     top_k_sections: int = Field(
         default=5, ge=1, le=50, description="Default number of sections to retrieve"
     )
+    embedding_cache_path: Optional[str] = Field(
+        default=None,
+        description=(
+            "Optional SQLite file used to persist query embeddings across "
+            "restarts, so repeated queries skip the embedding API call."
+        ),
+    )
     hybrid_search_weight: float = Field(
         default=0.7,
         ge=0.0,
@@ -101,6 +132,17 @@ class Settings(BaseSettings):
         ),
     )
 
+    answer_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Maximum cached query results (0 disables the answer cache)",
+    )
+    answer_cache_ttl_seconds: float = Field(
+        default=3600.0,
+        ge=0.0,
+        description="Seconds a cached query result stays valid",
+    )
+
     # ========================================================================
     # Telemetry Configuration (Weights & Biases)
     # ========================================================================
@@ -123,6 +165,11 @@ class Settings(BaseSettings):
     api_cors_origins: list[str] = Field(
         default=["*"], description="CORS allowed origins"
     )
+    api_thread_pool_size: int = Field(
+        default=32,
+        ge=1,
+        description="Threads available to blocking workflow/search calls from async routes",
+    )
 
     model_config = {
         "env_file": str(_env_path),
@@ -142,14 +189,23 @@ class Settings(BaseSettings):
             )
         return v
 
-    def model_post_init(self, __context) -> None:  # type: ignore[override]
-        """Construct DATABASE_URL if not explicitly provided."""
-        if not self.database_url:
-            self.database_url = (
-                f"postgresql://{self.postgres_user}:{self.postgres_password}"
-                f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
-            )
-            logger.debug("Constructed database_url from individual postgres settings")
+    @field_validator("database_url", mode="after")
+    @classmethod
+    def build_database_url(cls, v: str, info: ValidationInfo) -> str:
+        """Construct DATABASE_URL from the postgres_* fields if not provided.
+
+        Done during validation rather than by assigning in model_post_init,
+        which re-ran validation because of ``validate_assignment``.
+        """
+        data = info.data
+        if v or "postgres_db" not in data:
+            # Explicit URL, or a postgres_* field already failed validation
+            return v
+        logger.debug("Constructed database_url from individual postgres settings")
+        return (
+            f"postgresql://{data.get('postgres_user')}:{data.get('postgres_password')}"
+            f"@{data.get('postgres_host')}:{data.get('postgres_port')}/{data['postgres_db']}"
+        )
 
     @property
     def is_openai_configured(self) -> bool:
@@ -168,7 +224,10 @@ def get_settings() -> Settings:
 
     This function is cached to ensure only one Settings instance exists,
     preventing multiple environment variable reads and database URL constructions.
+    The .env file is also exported to os.environ here (once per process) for
+    libraries that read their own variables, such as the OpenAI client.
     """
+    load_dotenv(dotenv_path=_env_path, override=False)
     return Settings()
 
 
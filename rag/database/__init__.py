@@ -1,8 +1,9 @@
 """Database utilities for the RAG system."""
 
-from .connection import get_sync_connection, get_pool
+from .connection import get_async_pool, get_sync_connection, get_pool
 
 __all__ = [
+    "get_async_pool",
     "get_sync_connection",
     "get_pool",
 ]
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Iterator
 
 import psycopg
-from pgvector.psycopg import register_vector
-from psycopg_pool import ConnectionPool
+from pgvector.psycopg import register_vector, register_vector_async
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
 from rag.config import get_settings
 
@@ -16,6 +18,56 @@ logger = logging.getLogger(__name__)
 
 _settings = get_settings()
 _pool: ConnectionPool | None = None
+_async_pool: AsyncConnectionPool | None = None
+# Serializes first-time async pool creation, which awaits pool.open()
+_async_pool_lock = asyncio.Lock()
+
+
+# Pool size used when max_connections cannot be read
+_FALLBACK_POOL_MAX_SIZE = 5
+
+# Each process may run both the sync pool (retrieval/workflow) and the async
+# pool (route handlers); a derived budget is split evenly between them
+_POOLS_PER_PROCESS = 2
+
+
+@lru_cache(maxsize=1)
+def pool_max_size() -> int:
+    """
+    Return the connection limit for each of the sync and async pools.
+
+    DB_POOL_MAX_SIZE wins when set and applies to each pool. Otherwise
+    DB_POOL_FRACTION of the server's max_connections is shared across
+    APP_REPLICAS and split between the two pools of each process, then
+    clamped to [DB_POOL_MIN_SIZE, DB_POOL_HARD_CAP].
+    """
+    if _settings.db_pool_max_size is not None:
+        return max(_settings.db_pool_max_size, _settings.db_pool_min_size)
+
+    try:
+        with psycopg.connect(_settings.database_url, connect_timeout=10) as conn:
+            row = conn.execute("SHOW max_connections").fetchone()
+        server_max = int(row[0])
+    except Exception as e:
+        logger.warning(
+            f"Could not read max_connections ({e}); "
+            f"using pool max_size={_FALLBACK_POOL_MAX_SIZE}"
+        )
+        return max(_FALLBACK_POOL_MAX_SIZE, _settings.db_pool_min_size)
+
+    budget = int(server_max * _settings.db_pool_fraction) // (
+        _settings.app_replicas * _POOLS_PER_PROCESS
+    )
+    size = min(max(budget, _settings.db_pool_min_size), _settings.db_pool_hard_cap)
+    logger.info(f"Derived pool max_size={size} from max_connections={server_max}")
+    return size
+
+
+def _configure_connection(connection: psycopg.Connection) -> None:
+    """Register pgvector types once per new pooled connection."""
+    register_vector(connection)
+    # The type lookup opens a transaction; the pool expects an idle connection
+    connection.commit()
 
 
 def get_pool() -> ConnectionPool:
@@ -24,7 +76,7 @@ def get_pool() -> ConnectionPool:
 
     The pool maintains connections to PostgreSQL and reuses them
     for better performance. Connection pool size is configurable
-    via environment variables.
+    via environment variables (see pool_max_size).
 
     Returns:
         ConnectionPool: Configured connection pool instance
@@ -41,12 +93,13 @@ def get_pool() -> ConnectionPool:
             )
             _pool = ConnectionPool(
                 conninfo=_settings.database_url,
-                min_size=1,
-                max_size=10,
+                min_size=_settings.db_pool_min_size,
+                max_size=pool_max_size(),
                 kwargs={
                     "connect_timeout": 10,
                     "options": "-c statement_timeout=30000",  # 30 second statement timeout
                 },
+                configure=_configure_connection,
                 open=True,
             )
             logger.info("Database connection pool initialized successfully")
@@ -56,16 +109,66 @@ def get_pool() -> ConnectionPool:
     return _pool
 
 
+async def _configure_async_connection(connection: psycopg.AsyncConnection) -> None:
+    """Register pgvector types once per new pooled connection."""
+    await register_vector_async(connection)
+    # The type lookup opens a transaction; the pool expects an idle connection
+    await connection.commit()
+
+
+async def get_async_pool() -> AsyncConnectionPool:
+    """
+    Get or create a singleton async connection pool for FastAPI handlers.
+
+    Connections come with pgvector types registered, so async route handlers
+    can query the database without blocking the event loop.
+
+    Returns:
+        AsyncConnectionPool: Opened async connection pool instance
+
+    Raises:
+        psycopg.OperationalError: If unable to connect to database
+    """
+    global _async_pool
+    if _async_pool is not None:
+        return _async_pool
+
+    async with _async_pool_lock:
+        # Another caller may have created the pool while this one waited
+        if _async_pool is None:
+            logger.info("Initializing async database connection pool")
+            max_size = pool_max_size()
+            pool = AsyncConnectionPool(
+                conninfo=_settings.database_url,
+                min_size=min(max(_settings.db_pool_min_size, 4), max_size),
+                max_size=max_size,
+                kwargs={
+                    "connect_timeout": 10,
+                    "options": "-c statement_timeout=30000",  # 30 second statement timeout
+                    # The section endpoint repeats a handful of fixed queries;
+                    # prepare them server-side from their second execution on
+                    "prepare_threshold": 1,
+                },
+                configure=_configure_async_connection,
+                open=False,
+            )
+            # Block until min_size connections have finished connect/auth, so
+            # the first requests don't pay for the handshakes
+            await pool.open(wait=True)
+            _async_pool = pool
+    return _async_pool
+
+
 @contextmanager
 def get_sync_connection() -> Iterator[psycopg.Connection]:
     """
     Provide a managed synchronous database connection with pgvector support.
 
-    This context manager automatically:
-    - Gets a connection from the pool
-    - Registers pgvector types
+    Thin wrapper over ConnectionPool.connection(), which:
+    - Gets a connection from the pool (pgvector types are registered once
+      per connection by the pool)
+    - Commits on success, or rolls back if the block raises
     - Returns the connection to the pool when done
-    - Handles errors and ensures cleanup
 
     Usage:
         ```python
@@ -82,34 +185,13 @@ def get_sync_connection() -> Iterator[psycopg.Connection]:
         psycopg.OperationalError: If connection fails
         psycopg.DatabaseError: For other database errors
     """
-    pool = get_pool()
-    connection = None
-
     try:
-        connection = pool.getconn()
-        register_vector(connection)
-        yield connection
-
+        with get_pool().connection() as connection:
+            yield connection
     except psycopg.OperationalError as e:
         logger.error(f"Database operational error: {e}")
         raise
 
-    except psycopg.DatabaseError as e:
-        logger.error(f"Database error: {e}")
-        if connection:
-            connection.rollback()
-        raise
-
-    except Exception as e:
-        logger.error(f"Unexpected error in database connection: {e}")
-        if connection:
-            connection.rollback()
-        raise
-
-    finally:
-        if connection:
-            pool.putconn(connection)
-
 
 def test_connection() -> bool:
     """
@@ -141,3 +223,12 @@ def close_pool() -> None:
         _pool.close()
         _pool = None
         logger.info("Database connection pool closed")
+
+
+async def close_async_pool() -> None:
+    """Close the async connection pool, if one was opened."""
+    global _async_pool
+    if _async_pool:
+        logger.info("Closing async database connection pool")
+        await _async_pool.close()
+        _async_pool = None
@@ -37,11 +37,55 @@ CREATE TABLE IF NOT EXISTS sections (
     full_text_search tsvector GENERATED ALWAYS AS (
         to_tsvector('english', coalesce(title, '') || ' ' || coalesce(text, ''))
     ) STORED,
+    -- Copied from chapters by the triggers below so reads can skip the join
+    chapter_number INTEGER,
+    chapter_title TEXT,
     UNIQUE(chapter_id, section_number)
 );
 
 CREATE INDEX IF NOT EXISTS idx_sections_fts ON sections USING GIN(full_text_search);
 CREATE INDEX IF NOT EXISTS idx_sections_embedding ON sections USING hnsw (embedding vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_sections_section_number ON sections(section_number);
+CREATE INDEX IF NOT EXISTS idx_sections_original_number ON sections ((metadata->>'original_section_number'));
+
+-- Keep sections.chapter_number/chapter_title in step with chapters
+ALTER TABLE sections ADD COLUMN IF NOT EXISTS chapter_number INTEGER;
+ALTER TABLE sections ADD COLUMN IF NOT EXISTS chapter_title TEXT;
+
+CREATE OR REPLACE FUNCTION sections_fill_chapter() RETURNS trigger AS $$
+BEGIN
+    SELECT c.chapter_number, c.title
+    INTO NEW.chapter_number, NEW.chapter_title
+    FROM chapters c
+    WHERE c.id = NEW.chapter_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_sections_fill_chapter ON sections;
+CREATE TRIGGER trg_sections_fill_chapter
+    BEFORE INSERT OR UPDATE OF chapter_id ON sections
+    FOR EACH ROW EXECUTE FUNCTION sections_fill_chapter();
+
+CREATE OR REPLACE FUNCTION chapters_sync_sections() RETURNS trigger AS $$
+BEGIN
+    UPDATE sections
+    SET chapter_number = NEW.chapter_number, chapter_title = NEW.title
+    WHERE chapter_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_chapters_sync_sections ON chapters;
+CREATE TRIGGER trg_chapters_sync_sections
+    AFTER UPDATE OF chapter_number, title ON chapters
+    FOR EACH ROW EXECUTE FUNCTION chapters_sync_sections();
+
+-- Backfill rows written before the columns existed
+UPDATE sections s
+SET chapter_number = c.chapter_number, chapter_title = c.title
+FROM chapters c
+WHERE s.chapter_id = c.id AND s.chapter_number IS NULL;
 
 -- Numbered items table
 CREATE TABLE IF NOT EXISTS numbered_items (
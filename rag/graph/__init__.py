@@ -1,6 +1,6 @@
 """LangGraph workflow utilities."""
 
 from .state import QueryState
-from .workflow import build_workflow
+from .workflow import build_workflow, get_workflow
 
-__all__ = ["QueryState", "build_workflow"]
+__all__ = ["QueryState", "build_workflow", "get_workflow"]
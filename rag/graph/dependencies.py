@@ -26,6 +26,7 @@ def get_embedder() -> OpenAIEmbedder:
         model=settings.embedding_model,
         api_key=settings.openai_api_key,
         allow_fallback=not settings.is_openai_configured,
+        cache_path=settings.embedding_cache_path or None,
     )
 
 
@@ -4,81 +4,36 @@ from __future__ import annotations
 
 import logging
 import textwrap
-from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, Iterable, List, Optional
 
-from langchain_openai import ChatOpenAI
-
 from rag.config import settings
-from rag.graph.state import QueryState
-from rag.ingestion.embedder import OpenAIEmbedder
-from rag.retrieval import (
-    ContextBuilder,
-    HybridSearcher,
-    ReferenceResolver,
-    VectorSearcher,
+from rag.graph.dependencies import (
+    get_chat_model,
+    get_context_builder,
+    get_hybrid_searcher,
+    get_reference_resolver,
+    get_vector_searcher,
 )
+from rag.graph.state import QueryState
 from rag.retrieval.types import SectionResult
 from rag.utils.telemetry import log_event
 
 logger = logging.getLogger(__name__)
 
+# LLM prompt for generate_answer, dedented once at import and filled per query
+_PROMPT_TEMPLATE = textwrap.dedent(
+    """
+    You are a building code expert. Answer the question using the provided context.
 
-# --------------------------------------------------------------------------- #
-# Dependency singletons (cached for performance)
-# --------------------------------------------------------------------------- #
-
-
-@lru_cache(maxsize=1)
-def get_embedder() -> OpenAIEmbedder:
-    """Get cached embedder instance."""
-    return OpenAIEmbedder(
-        model=settings.embedding_model,
-        api_key=settings.openai_api_key,
-        allow_fallback=not settings.is_openai_configured,
-    )
-
-
-@lru_cache(maxsize=1)
-def get_vector_searcher() -> VectorSearcher:
-    """Get cached vector searcher instance."""
-    return VectorSearcher(get_embedder())
-
-
-@lru_cache(maxsize=1)
-def get_hybrid_searcher() -> HybridSearcher:
-    """Get cached hybrid searcher instance."""
-    return HybridSearcher(get_embedder())
-
-
-@lru_cache(maxsize=1)
-def get_context_builder() -> ContextBuilder:
-    """Get cached context builder instance."""
-    return ContextBuilder()
-
-
-@lru_cache(maxsize=1)
-def get_reference_resolver() -> ReferenceResolver:
-    """Get cached reference resolver instance."""
-    return ReferenceResolver()
-
+    Question: {query}
 
-@lru_cache(maxsize=1)
-def get_chat_model() -> ChatOpenAI | None:
-    """Get cached LLM instance, or None if not configured."""
-    if not settings.is_openai_configured:
-        logger.warning("OpenAI API key not configured - using fallback answers")
-        return None
+    Context:
+    {context}
 
-    try:
-        return ChatOpenAI(
-            model=settings.chat_model,
-            temperature=settings.temperature,
-            openai_api_key=settings.openai_api_key,
-        )
-    except Exception as exc:
-        logger.error(f"Failed to initialize ChatOpenAI: {exc}", exc_info=True)
-        return None
+    Provide a concise answer and mention relevant section numbers.
+    """
+).strip()
 
 
 # --------------------------------------------------------------------------- #
@@ -238,18 +193,7 @@ def generate_answer(state: QueryState) -> QueryState:
 
     model = get_chat_model()
     if model:
-        prompt = textwrap.dedent(
-            f"""
-            You are a building code expert. Answer the question using the provided context.
-
-            Question: {state['query']}
-
-            Context:
-            {context_text}
-
-            Provide a concise answer and mention relevant section numbers.
-            """
-        ).strip()
+        prompt = _PROMPT_TEMPLATE.format(query=state["query"], context=context_text)
         try:
             response = model.invoke(prompt)
             answer = response.content if hasattr(response, "content") else str(response)
@@ -294,35 +238,25 @@ def format_response(state: QueryState) -> QueryState:
         md_parts.append("### References")
 
         # 1. Sections
-        # Combine citations and referenced sections
-        seen_sections = set()
-        section_lines = []
-
-        # Add citations first
+        # Merge citations (first) and referenced sections keyed by section
+        # number; insertion order is kept and each unique section is
+        # formatted once
+        merged_sections = {}
         for cit in citations:
             sec_num = cit.get("section_number")
-            if sec_num and sec_num not in seen_sections:
-                seen_sections.add(sec_num)
-                title = cit.get("title") or ""
-                section_lines.append(
-                    format_reference_line(
-                        label=f"Section {sec_num}",
-                        title=title,
-                        page_number=cit.get("page"),
-                    )
-                )
-
-        # Add referenced sections
+            if sec_num:
+                merged_sections.setdefault(sec_num, (cit.get("title") or "", cit.get("page")))
         for sec in ref_sections:
-            if sec.section_number not in seen_sections:
-                seen_sections.add(sec.section_number)
-                section_lines.append(
-                    format_reference_line(
-                        label=f"Section {sec.section_number}",
-                        title=sec.title,
-                        page_number=sec.page_number,
-                    )
-                )
+            merged_sections.setdefault(sec.section_number, (sec.title, sec.page_number))
+
+        section_lines = [
+            format_reference_line(
+                label=f"Section {sec_num}",
+                title=title,
+                page_number=page_number,
+            )
+            for sec_num, (title, page_number) in merged_sections.items()
+        ]
 
         if section_lines:
             md_parts.append("#### Sections\n" + "\n".join(section_lines))
@@ -444,22 +378,28 @@ def build_extractive_answer(sections: Iterable[SectionResult]) -> str:
     return " ".join(parts)
 
 
+# SectionResult fields included in API payloads, read in a single attrgetter call
+_SECTION_FIELDS = (
+    "id",
+    "section_number",
+    "title",
+    "text",
+    "chapter_id",
+    "chapter_number",
+    "chapter_title",
+    "depth",
+    "parent_section_id",
+    "page_number",
+    "metadata",
+    "score",
+)
+_get_section_fields = attrgetter(*_SECTION_FIELDS)
+
+
 def section_to_dict(section: SectionResult) -> Dict:
-    return {
-        "id": section.id,
-        "section_number": section.section_number,
-        "title": section.title,
-        "text": section.text,
-        "chapter_id": section.chapter_id,
-        "chapter_number": section.chapter_number,
-        "chapter_title": section.chapter_title,
-        "depth": section.depth,
-        "parent_section_id": section.parent_section_id,
-        "page_number": section.page_number,
-        "metadata": section.metadata,
-        "score": section.score,
-        "url": build_reference_url(section.page_number),
-    }
+    data = dict(zip(_SECTION_FIELDS, _get_section_fields(section)))
+    data["url"] = build_reference_url(section.page_number)
+    return data
 
 
 def table_to_dict(table) -> Dict:
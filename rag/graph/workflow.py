@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from langgraph.graph import StateGraph
 
 from rag.graph import nodes
@@ -34,3 +36,9 @@ def build_workflow():
     graph.set_finish_point("format")
 
     return graph.compile()
+
+
+@lru_cache(maxsize=1)
+def get_workflow():
+    """Get the compiled workflow, built once per process."""
+    return build_workflow()
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import itertools
-from typing import Dict, List, Protocol, Sequence
+import sqlite3
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Protocol, Sequence
 
 try:
     from langchain_openai import OpenAIEmbeddings
@@ -28,6 +33,61 @@ class Embedder(Protocol):
         """Generate embeddings for the provided texts."""
 
 
+class EmbeddingDiskCache:
+    """SQLite-backed store of embedding vectors keyed by (model, text) digest.
+
+    Safe to share between threads (e.g. API requests served from a pool).
+    """
+
+    # Stay well below SQLite's host-parameter limit for IN (...) lookups
+    _LOOKUP_CHUNK = 500
+
+    def __init__(self, path: str | Path, model: str) -> None:
+        self.path = Path(path)
+        self.model = model
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.model}\x00{text}".encode("utf-8")).digest()
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """Return cached vectors for the texts that have been embedded before."""
+
+        keys = {self.key(text): text for text in texts}
+        found: Dict[str, List[float]] = {}
+        key_list = list(keys)
+        with self._lock:
+            for start in range(0, len(key_list), self._LOOKUP_CHUNK):
+                chunk = key_list[start : start + self._LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM cache WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[keys[key]] = array("f", blob).tolist()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, Sequence[float]]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO cache (key, vec) VALUES (?, ?)",
+                ((self.key(text), array("f", vector).tobytes()) for text, vector in items),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class OpenAIEmbedder:
     """Embedding implementation backed by OpenAI with optional deterministic fallback."""
 
@@ -37,15 +97,21 @@ class OpenAIEmbedder:
         model: str,
         api_key: str | None,
         batch_size: int = 64,
+        concurrency: int = 1,
         dimensions: int = 1536,
         allow_fallback: bool = False,
+        cache_path: str | Path | None = None,
     ) -> None:
         self.model = model
         self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
         self.dimensions = dimensions
         self.allow_fallback = allow_fallback
         self._client = None
         self._cache: Dict[str, List[float]] = {}
+        self._disk_cache = (
+            EmbeddingDiskCache(cache_path, model) if cache_path is not None else None
+        )
 
         if api_key and OpenAIEmbeddings is not None:
             self._client = OpenAIEmbeddings(model=model, openai_api_key=api_key)
@@ -81,6 +147,19 @@ class OpenAIEmbedder:
             else:
                 pending.append((idx, text))
 
+        if pending and self._client is not None and self._disk_cache is not None:
+            stored = self._disk_cache.get_many(text for _, text in pending)
+            if stored:
+                remaining: List[tuple[int, str]] = []
+                for idx, text in pending:
+                    vector = stored.get(text)
+                    if vector is None:
+                        remaining.append((idx, text))
+                    else:
+                        self._cache[text] = vector
+                        results[idx] = vector
+                pending = remaining
+
         if pending:
             if self._client is None:
                 for idx, text in pending:
@@ -88,24 +167,52 @@ class OpenAIEmbedder:
                     self._cache[text] = vector
                     results[idx] = vector
             else:
-                for start in range(0, len(pending), self.batch_size):
-                    batch = pending[start : start + self.batch_size]
-                    batch_texts = [text for _, text in batch]
-                    if hasattr(self._client, "embed_documents"):
-                        # langchain-openai client
-                        embeddings = self._client.embed_documents(batch_texts)
-                    else:
-                        # fallback to the OpenAI SDK
-                        resp = self._client.Embeddings.create(
-                            model=self.model, input=batch_texts
+                batches = [
+                    pending[start : start + self.batch_size]
+                    for start in range(0, len(pending), self.batch_size)
+                ]
+                batch_texts = [[text for _, text in batch] for batch in batches]
+                workers = min(self.concurrency, len(batches))
+                if workers > 1:
+                    # API calls are network-bound; overlap them across threads.
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        batch_embeddings = list(
+                            executor.map(self._embed_batch, batch_texts)
                         )
-                        embeddings = [item["embedding"] for item in resp.data]
+                else:
+                    batch_embeddings = [self._embed_batch(texts) for texts in batch_texts]
+
+                for batch, embeddings in zip(batches, batch_embeddings):
                     for (idx, text), vector in zip(batch, embeddings):
                         self._cache[text] = vector
                         results[idx] = vector
 
+                if self._disk_cache is not None:
+                    self._disk_cache.put_many(
+                        (text, results[idx]) for idx, text in pending
+                    )
+
         return results
 
+    def cache_stats(self) -> Dict[str, int]:
+        """Report in-memory cache size and persistent cache hit/miss counts."""
+
+        stats = {"memory_entries": len(self._cache)}
+        if self._disk_cache is not None:
+            stats["disk_hits"] = self._disk_cache.hits
+            stats["disk_misses"] = self._disk_cache.misses
+        return stats
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a single batch with the configured client."""
+
+        if hasattr(self._client, "embed_documents"):
+            # langchain-openai client
+            return self._client.embed_documents(texts)
+        # fallback to the OpenAI SDK
+        resp = self._client.Embeddings.create(model=self.model, input=texts)
+        return [item["embedding"] for item in resp.data]
+
     def _fallback_embedding(self, text: str) -> List[float]:
         """Return a deterministic pseudo embedding (good for development/testing)."""
 
@@ -25,6 +25,8 @@ class IngestionPipeline:
         enable_embeddings: bool = True,
         allow_embedding_fallback: bool = False,
         embedding_batch_size: int = 64,
+        embedding_concurrency: int = 1,
+        embedding_cache_path: str | Path | None = None,
     ) -> None:
         self.enable_embeddings = enable_embeddings
         self.embedder = embedder
@@ -33,6 +35,8 @@ class IngestionPipeline:
                 model=settings.embedding_model,
                 api_key=settings.openai_api_key,
                 batch_size=embedding_batch_size,
+                concurrency=embedding_concurrency,
+                cache_path=embedding_cache_path,
                 allow_fallback=allow_embedding_fallback,
             )
         self.writer = DatabaseWriter()
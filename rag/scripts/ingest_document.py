@@ -30,6 +30,12 @@ def parse_args() -> argparse.Namespace:
         default=64,
         help="Batch size for embedding API calls (default: 64).",
     )
+    parser.add_argument(
+        "--embedding-concurrency",
+        type=int,
+        default=4,
+        help="Number of embedding batches to request in parallel (default: 4).",
+    )
     return parser.parse_args()
 
 
@@ -39,6 +45,7 @@ def main() -> int:
         enable_embeddings=not args.skip_embeddings,
         allow_embedding_fallback=args.allow_embed_fallback,
         embedding_batch_size=args.embedding_batch_size,
+        embedding_concurrency=args.embedding_concurrency,
     )
     document_id = pipeline.ingest(args.source)
     print(f"Ingested document ID: {document_id}")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import sys
 import textwrap
 from typing import Sequence
 
@@ -62,17 +63,19 @@ def main() -> int:
         print("No sections found.")
         return 0
 
-    print(f"\nTop {len(results)} sections for query: {args.query!r}\n")
+    # Collect the listing and write it once rather than print()ing line by line
+    out = ["", f"Top {len(results)} sections for query: {args.query!r}", ""]
     for idx, section in enumerate(results, 1):
         snippet = section.text.replace("\n", " ").strip()
         if len(snippet) > args.max_snippet:
             snippet = snippet[: args.max_snippet] + "..."
-        print(f"{idx}. {section.section_number} – {section.title} (score={section.score:.3f})")
-        print(textwrap.fill(snippet, width=100))
-        print(f"   Chapter {section.chapter_number}: {section.chapter_title}")
+        out.append(f"{idx}. {section.section_number} – {section.title} (score={section.score:.3f})")
+        out.append(textwrap.fill(snippet, width=100))
+        out.append(f"   Chapter {section.chapter_number}: {section.chapter_title}")
         if section.page_number:
-            print(f"   Page: {section.page_number}")
-        print()
+            out.append(f"   Page: {section.page_number}")
+        out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
     if args.show_context:
         builder = ContextBuilder()